@@ -0,0 +1,31 @@
+"""Unique index on drug interaction pair
+
+Revision ID: 9c2d4e7b1a05
+Revises: 430f771a4007
+Create Date: 2026-10-15 10:12:41.204518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c2d4e7b1a05'
+down_revision: Union[str, None] = '430f771a4007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keep the first row of any duplicated pair so the unique index can be built
+    op.execute(
+        "DELETE FROM drug_interactions WHERE id NOT IN "
+        "(SELECT MIN(id) FROM drug_interactions GROUP BY drug_a, drug_b)"
+    )
+    op.create_index('uq_drug_interactions_drug_a_drug_b', 'drug_interactions', ['drug_a', 'drug_b'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index('uq_drug_interactions_drug_a_drug_b', table_name='drug_interactions')
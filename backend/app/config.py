@@ -12,6 +12,8 @@ class Settings(BaseSettings):
     # Database
     database_url: str = "sqlite+aiosqlite:///./healthrevo.db"
     database_url_sync: str = "sqlite:///./healthrevo.db"
+    db_pool_size: int = 20
+    db_max_overflow: int = 40
     
     # JWT
     jwt_secret_key: str = "your-super-secret-jwt-key-change-this"
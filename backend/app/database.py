@@ -1,23 +1,82 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from app.config import settings
 
+
+def _async_pool_options(database_url: str) -> dict:
+    """Connection pool settings for the async engine."""
+    if make_url(database_url).get_backend_name() == "sqlite":
+        # Keep aiosqlite's default pool: pooled connections hold non-daemon worker
+        # threads open, so scripts using AsyncSessionLocal would never exit
+        return {}
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_pre_ping": True,
+    }
+
+
 # Create async engine for async operations
 async_engine = create_async_engine(
     settings.database_url,
     echo=settings.debug,
-    future=True
+    future=True,
+    **_async_pool_options(settings.database_url)
 )
 
+def _sync_engine_options(database_url: str) -> dict:
+    """Driver-specific settings for the sync engine."""
+    if make_url(database_url).get_dialect().driver == "psycopg2":
+        # Multi-row VALUES for bulk inserts, execute_batch for other executemany calls
+        return {"executemany_mode": "values_plus_batch"}
+    return {}
+
+
 # Create sync engine for migrations and sync operations
 sync_engine = create_engine(
     settings.database_url_sync,
     echo=settings.debug,
-    future=True
+    future=True,
+    **_sync_engine_options(settings.database_url_sync)
+)
+
+# Applied to every new SQLite connection (aiosqlite's default pool opens one per session):
+# synchronous=NORMAL only fsyncs at WAL checkpoints instead of on every commit
+_SQLITE_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
 )
 
+# WAL lets readers run alongside a writer. The mode is stored in the database file,
+# so it is set on the first connection only; switching modes needs a lock, and a
+# failed attempt (database busy) is retried on the next connection.
+_sqlite_wal_enabled = False
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    global _sqlite_wal_enabled
+    cursor = dbapi_connection.cursor()
+    try:
+        if not _sqlite_wal_enabled:
+            try:
+                cursor.execute("PRAGMA journal_mode=WAL")
+                _sqlite_wal_enabled = True
+            except Exception:
+                pass
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
+for _engine in (async_engine.sync_engine, sync_engine):
+    if _engine.dialect.name == "sqlite":
+        event.listen(_engine, "connect", _set_sqlite_pragmas)
+
 # Create async session factory
 AsyncSessionLocal = async_sessionmaker(
     bind=async_engine,
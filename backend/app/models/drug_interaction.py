@@ -1,9 +1,13 @@
-from sqlalchemy import Column, Integer, String, Text
+from sqlalchemy import Column, Index, Integer, String, Text
 from app.database import Base
 
 
 class DrugInteraction(Base):
     __tablename__ = "drug_interactions"
+    __table_args__ = (
+        # One row per ordered pair; lets seeding skip rows that are already loaded
+        Index("uq_drug_interactions_drug_a_drug_b", "drug_a", "drug_b", unique=True),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     drug_a = Column(String(255), nullable=False, index=True)
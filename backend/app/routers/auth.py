@@ -3,6 +3,7 @@ from fastapi.security import HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from datetime import timedelta
+import asyncio
 
 from app.database import get_async_db
 from app.models.user import User
@@ -30,8 +31,8 @@ async def signup(
     if existing_user:
         raise ConflictError("Email already registered")
     
-    # Create new user
-    hashed_password = get_password_hash(user_data.password)
+    # Create new user (bcrypt runs in a worker thread so it doesn't block the event loop)
+    hashed_password = await asyncio.to_thread(get_password_hash, user_data.password)
     
     new_user = User(
         email=user_data.email,
@@ -65,7 +66,8 @@ async def login(
     result = await db.execute(select(User).where(User.email == credentials.email))
     user = result.scalar_one_or_none()
     
-    if not user or not verify_password(credentials.password, user.password_hash):
+    # bcrypt verification runs in a worker thread so it doesn't block the event loop
+    if not user or not await asyncio.to_thread(verify_password, credentials.password, user.password_hash):
         raise AuthenticationError("Invalid email or password")
     
     if not user.is_active:
@@ -1,9 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
 from datetime import datetime
+import json
 
 from app.database import get_async_db
 from app.models.user import User
@@ -13,7 +15,7 @@ from app.models.risk_score import RiskScore
 from app.dependencies import get_current_user, get_patient_or_doctor_access, get_current_patient
 from app.models.prescription import Prescription
 from app.models.alert import Alert
-from app.services.gemini_chat_service import GeminiChatService
+from app.services.gemini_chat_service import GeminiChatService, get_chat_service
 from app.core.exceptions import ProcessingError, NotFoundError
 
 router = APIRouter()
@@ -36,7 +38,8 @@ async def chat_with_ai(
     patient_id: int,
     chat_data: ChatMessage,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_async_db)
+    db: AsyncSession = Depends(get_async_db),
+    chat_service: GeminiChatService = Depends(get_chat_service)
 ):
     """Chat with AI assistant about patient health data."""
     
@@ -85,9 +88,6 @@ async def chat_with_ai(
     recent_alerts = alerts_result.scalars().all()
     
     try:
-        # Initialize Gemini chat service
-        chat_service = GeminiChatService()
-
         # Generate AI response
         result = await chat_service.chat_with_patient(
             message=chat_data.message,
@@ -125,11 +125,80 @@ async def chat_with_ai(
         )
 
 
+@router.post("/{patient_id}/chat/stream")
+async def stream_chat_with_ai(
+    patient_id: int,
+    chat_data: ChatMessage,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    chat_service: GeminiChatService = Depends(get_chat_service)
+):
+    """Chat with AI assistant, streaming the response as Server-Sent Events.
+
+    Each event carries a JSON payload: ``{"text": ...}`` for response chunks and a
+    final ``{"done": true, "model": ..., "timestamp": ..., "success": ...}``.
+    """
+    
+    # Verify access to patient data
+    patient = await get_patient_or_doctor_access(patient_id, current_user, db)
+    
+    # Get recent vitals (last 7 days)
+    from datetime import timedelta
+    week_ago = datetime.now() - timedelta(days=7)
+    
+    vitals_result = await db.execute(
+        select(Vitals)
+        .where(Vitals.patient_id == patient_id)
+        .where(Vitals.recorded_at >= week_ago)
+        .order_by(Vitals.recorded_at.desc())
+        .limit(10)
+    )
+    recent_vitals = vitals_result.scalars().all()
+    
+    # Get recent risk scores
+    risk_result = await db.execute(
+        select(RiskScore)
+        .where(RiskScore.patient_id == patient_id)
+        .order_by(RiskScore.computed_at.desc())
+        .limit(5)
+    )
+    recent_risk_scores = risk_result.scalars().all()
+    
+    chat_history = chat_data.context.get("chat_history", []) if chat_data.context else []
+
+    async def event_stream():
+        success = True
+        try:
+            async for text in chat_service.stream_chat_with_patient(
+                message=chat_data.message,
+                patient=patient,
+                recent_vitals=list(recent_vitals),
+                recent_risk_scores=list(recent_risk_scores),
+                chat_history=chat_history
+            ):
+                yield f"data: {json.dumps({'text': text})}\n\n"
+        except Exception:
+            # Do not break the stream; finish with a safe fallback chunk
+            success = False
+            fallback = "I'm sorry, I'm having trouble processing your request right now. Please try again later."
+            yield f"data: {json.dumps({'text': fallback})}\n\n"
+        done = {
+            "done": True,
+            "model": chat_service.model_name if success else "local-fallback",
+            "timestamp": datetime.utcnow().isoformat(),
+            "success": success,
+        }
+        yield f"data: {json.dumps(done)}\n\n"
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
 @router.post("/me/chat", response_model=ChatResponse)
 async def chat_with_ai_me(
     chat_data: ChatMessage,
     current_patient: Patient = Depends(get_current_patient),
-    db: AsyncSession = Depends(get_async_db)
+    db: AsyncSession = Depends(get_async_db),
+    chat_service: GeminiChatService = Depends(get_chat_service)
 ):
     """Chat with AI assistant for the authenticated patient (no patient_id needed)."""
 
@@ -162,7 +231,6 @@ async def chat_with_ai_me(
     chat_history = chat_data.context.get("chat_history", []) if chat_data.context else []
 
     try:
-        chat_service = GeminiChatService()
         result = await chat_service.chat_with_patient(
             message=chat_data.message,
             patient=current_patient,
@@ -197,7 +265,8 @@ async def chat_with_ai_me(
 async def generate_health_summary(
     patient_id: int,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_async_db)
+    db: AsyncSession = Depends(get_async_db),
+    chat_service: GeminiChatService = Depends(get_chat_service)
 ):
     """Generate AI-powered health summary for patient."""
     
@@ -226,9 +295,6 @@ async def generate_health_summary(
     recent_risk_scores = risk_result.scalars().all()
     
     try:
-        # Initialize Gemini chat service
-        chat_service = GeminiChatService()
-        
         # Generate health summary
         summary = await chat_service.generate_health_summary(
             patient=patient,
@@ -1,9 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, File, HTTPException, UploadFile, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from typing import List, Dict, Any
+import asyncio
+import os
+import uuid
 
-from app.database import get_async_db
+import aiofiles
+
+from app.config import settings
+from app.database import get_async_db, AsyncSessionLocal
 from app.models.prescription import Prescription
 from app.dependencies import get_patient_or_doctor_access, get_current_user
 from app.models.user import User
@@ -141,6 +147,118 @@ async def create_prescription(
 	}
 
 
+_OCR_EXTENSIONS = {".pdf", ".jpg", ".jpeg", ".png", ".bmp", ".tiff"}
+
+
+def _run_ocr(file_path: str) -> Dict[str, Any]:
+	"""Run OCR on a worker thread; Tesseract/OpenCV calls block."""
+	# Imported lazily so the router loads even where OCR dependencies are missing
+	from app.services.ocr_service import OCRService
+	return asyncio.run(OCRService().process_file(file_path))
+
+
+async def _process_prescription_upload(prescription_id: int) -> None:
+	"""Background job: OCR an uploaded prescription file, then parse and analyze it."""
+	async with AsyncSessionLocal() as db:
+		pres = await db.get(Prescription, prescription_id)
+		if not pres:
+			return
+		pres.processing_status = "processing"
+		await db.commit()
+
+		try:
+			result = await asyncio.to_thread(_run_ocr, pres.file_path)
+			if not result.get("success"):
+				raise ValueError(result.get("error") or "OCR failed")
+
+			ocr_text = result.get("text", "")
+			meds = _parse_free_text_prescription(ocr_text)
+			analysis = await analyze_prescription(db, meds)
+
+			pres.ocr_text = ocr_text
+			pres.parsed_medications = meds
+			pres.flags = analysis.get("flags", [])
+			pres.processing_status = "completed"
+		except Exception as e:
+			# The failure may have come from the database; clear the failed transaction first
+			await db.rollback()
+			pres.processing_status = "error"
+			pres.error_message = str(e)
+		await db.commit()
+
+
+@router.post("/{patient_id}/prescriptions/upload", status_code=status.HTTP_202_ACCEPTED)
+async def upload_prescription(
+	patient_id: int,
+	background_tasks: BackgroundTasks,
+	file: UploadFile = File(...),
+	current_user: User = Depends(get_current_user),
+	_: Any = Depends(get_patient_or_doctor_access),
+	db: AsyncSession = Depends(get_async_db)
+):
+	"""Upload a prescription image/PDF. OCR runs in the background; poll the prescription for its status."""
+	ext = os.path.splitext(file.filename or "")[1].lower()
+	if ext not in _OCR_EXTENSIONS:
+		raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=f"Unsupported file format: {ext or 'unknown'}")
+
+	content = await file.read()
+	if len(content) > settings.max_file_size:
+		raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail="File too large")
+
+	os.makedirs(settings.upload_dir, exist_ok=True)
+	file_path = os.path.join(settings.upload_dir, f"{uuid.uuid4().hex}{ext}")
+	async with aiofiles.open(file_path, "wb") as out:
+		await out.write(content)
+
+	pres = Prescription(
+		patient_id=patient_id,
+		uploaded_by=current_user.id,
+		original_filename=file.filename,
+		file_path=file_path,
+		file_size=len(content),
+		processing_status="pending",
+	)
+	db.add(pres)
+	await db.commit()
+	await db.refresh(pres)
+
+	background_tasks.add_task(_process_prescription_upload, pres.id)
+
+	return {
+		"id": pres.id,
+		"patientId": pres.patient_id,
+		"status": pres.processing_status,
+		"originalFilename": pres.original_filename,
+	}
+
+
+@router.get("/{patient_id}/prescriptions/{prescription_id}")
+async def get_prescription(
+	patient_id: int,
+	prescription_id: int,
+	_: Any = Depends(get_patient_or_doctor_access),
+	db: AsyncSession = Depends(get_async_db)
+):
+	"""Get a single prescription, including its processing status (used to poll uploads)."""
+	result = await db.execute(select(Prescription).where(Prescription.id == prescription_id, Prescription.patient_id == patient_id))
+	pres = result.scalar_one_or_none()
+	if not pres:
+		raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Prescription not found")
+
+	return {
+		"id": pres.id,
+		"patientId": pres.patient_id,
+		"uploadedBy": pres.uploaded_by,
+		"uploadedAt": pres.uploaded_at.isoformat() if pres.uploaded_at else None,
+		"status": pres.processing_status,
+		"error": pres.error_message,
+		"ocrText": pres.ocr_text,
+		"parsedMedications": pres.parsed_medications or [],
+		"flags": pres.flags or [],
+		"originalFilename": pres.original_filename,
+	}
+
+
 @router.patch("/{patient_id}/prescriptions/{prescription_id}")
 async def update_prescription(
 	patient_id: int,
@@ -1,7 +1,62 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, Dict
+
+from app.database import get_async_db
+from app.models.risk_score import RiskScore
+from app.models.user import User
+from app.dependencies import get_current_user, get_patient_or_doctor_access
+from app.services.risk_service import compute_patient_risks
 
 router = APIRouter()
 
-# Risk score endpoints will be implemented here
-# POST /{patient_id}/compute_risk - Compute risk scores
-# GET /{patient_id}/risk_scores - Get risk history
+# GET /{patient_id}/risk_scores - Get risk history will be implemented here
+
+
+def _risk_to_dict(r: RiskScore) -> Dict[str, Any]:
+	return {
+		"id": r.id,
+		"patientId": r.patient_id,
+		"computedAt": r.computed_at.isoformat() if r.computed_at else None,
+		"riskType": r.risk_type,
+		"score": float(r.score) if r.score is not None else None,
+		"riskLevel": r.risk_level,
+		"drivers": r.drivers,
+		"recommendations": r.recommendations,
+		"method": r.method,
+		"confidence": float(r.confidence_score) if r.confidence_score is not None else None,
+	}
+
+
+@router.post("/{patient_id}/compute_risk")
+async def compute_risk(
+	patient_id: int,
+	current_user: User = Depends(get_current_user),
+	db: AsyncSession = Depends(get_async_db),
+):
+	"""Compute and store hypertension/diabetes risk scores from the patient's recent vitals."""
+
+	# Access control (returns patient or raises)
+	await get_patient_or_doctor_access(patient_id, current_user, db)
+
+	# Aggregated in SQL and cached until the patient records new vitals
+	results = await compute_patient_risks(db, patient_id)
+
+	scores = [
+		RiskScore(
+			patient_id=patient_id,
+			risk_type=risk_type,
+			score=result["score"],
+			risk_level=result["risk_level"],
+			drivers=result["drivers"],
+			recommendations=result.get("recommendations", []),
+			method="heuristic-v1",
+			confidence_score=result["confidence"],
+		)
+		for risk_type, result in results.items()
+	]
+	db.add_all(scores)
+	await db.commit()
+	for score in scores:
+		await db.refresh(score)
+	return [_risk_to_dict(s) for s in scores]
@@ -1,4 +1,6 @@
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+from collections import OrderedDict
+from functools import lru_cache
 try:
     import google.generativeai as genai
 except Exception:  # Module may not be installed; fallback mode will be used
@@ -8,25 +10,89 @@ from app.models.patient import Patient
 from app.models.vitals import Vitals
 from app.models.risk_score import RiskScore
 import json
+import logging
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+
+
+_FALLBACK_RESPONSE = (
+    "I’m here to help explain your health data. While I can’t replace medical advice, "
+    "here’s some general guidance based on your recent information. If you’re worried or "
+    "have urgent symptoms, please contact your healthcare provider or emergency services."
+)
+
+# Static parts of the chat system prompt; only the patient section is formatted per call
+_SYSTEM_PREFIX = (
+    "You are a helpful medical AI assistant for HealthRevo, designed to help patients understand their health data and provide general health guidance.\n\n"
+    "IMPORTANT GUIDELINES:\n"
+    "- Always emphasize that you cannot replace professional medical advice\n"
+    "- For urgent symptoms or emergencies, direct patients to seek immediate medical care\n"
+    "- Provide educational information in simple, understandable language\n"
+    "- Be supportive and encouraging while being factually accurate\n"
+    "- If unsure about something, recommend consulting with their healthcare provider\n\n"
+)
+
+_DYNAMIC_TEMPLATE = (
+    "PATIENT CONTEXT:\n"
+    "- Name: {name}\n"
+    "- Age: {age} years\n"
+    "- Gender: {gender}\n"
+    "- Blood group: {blood_group}\n\n"
+    "CURRENT HEALTH DATA:\n"
+    "- {vitals}\n"
+    "- {risk}\n\n"
+)
+
+_SYSTEM_SUFFIX = (
+    "When answering questions:\n"
+    "1. Use the patient's health data to provide personalized context when relevant\n"
+    "2. Explain medical terms in simple language\n"
+    "3. Provide actionable, safe recommendations\n"
+    "4. Always remind patients to consult their healthcare provider for medical decisions\n"
+    "5. Be empathetic and supportive\n\n"
+    "Remember: You are an educational assistant, not a replacement for medical professionals."
+)
+
+# Speaker labels for chat history entries included in the prompt
+_ROLE_LABELS = {"user": "Patient", "assistant": "Assistant"}
+
+# Rendered system prompts keyed by patient/profile version, latest vital and risk score ids
+_PROMPT_CACHE_MAXSIZE = 1024
+_prompt_cache: "OrderedDict[Tuple, str]" = OrderedDict()
+
+
+# Shared model, set on the first successful configuration only, so a transient
+# failure or a key configured later is retried on the next call
+_model = None
+
+
+def _get_model():
+    """Configure the Gemini SDK once per process and return the shared model, or None."""
+    global _model
+    if _model is None and settings.google_gemini_api_key and genai is not None:
+        try:
+            genai.configure(api_key=settings.google_gemini_api_key)
+            _model = genai.GenerativeModel(settings.gemini_model)
+        except Exception:
+            logger.exception("Gemini model initialization failed; using local fallback")
+    return _model
+
 
 class GeminiChatService:
     """Google Gemini AI chat service for patient health assistance.
     Falls back to a local templated response if API key is not set.
     """
     
-    def __init__(self):
-        # Configure Gemini API if available
-        self._use_gemini = False
-        try:
-            if settings.google_gemini_api_key and genai is not None:
-                genai.configure(api_key=settings.google_gemini_api_key)
-                self.model = genai.GenerativeModel(settings.gemini_model)
-                self._use_gemini = True
-        except Exception:
-            # Fallback to local mode
-            self._use_gemini = False
+    @property
+    def model(self):
+        # Process-wide model, looked up per use so the shared service picks it up
+        # once it becomes available; None means local fallback mode
+        return _get_model()
+    
+    @property
+    def _use_gemini(self) -> bool:
+        return self.model is not None
     
     async def chat_with_patient(
         self,
@@ -52,44 +118,26 @@ class GeminiChatService:
         """
         
         try:
-            # Build context prompt with patient data
-            system_prompt = self._build_system_prompt(
-                patient, recent_vitals, recent_risk_scores, patient_name=patient_name
+            full_prompt = self._build_full_prompt(
+                message, patient, recent_vitals, recent_risk_scores, chat_history, patient_name
             )
             
-            # Build conversation history
-            conversation_context = self._build_conversation_context(
-                chat_history, message
-            )
-            
-            # Combine system prompt with conversation
-            full_prompt = f"{system_prompt}\n\n{conversation_context}"
-            
             # Generate response using Gemini or fallback
             if self._use_gemini:
                 response = self.model.generate_content(
                     full_prompt,
-                    generation_config=genai.types.GenerationConfig(
-                        temperature=0.7,
-                        max_output_tokens=500,
-                        top_p=0.8,
-                        top_k=40
-                    )
+                    generation_config=self._chat_generation_config()
                 )
                 # Extract response text
                 ai_response = response.text if getattr(response, "text", None) else "I apologize, but I couldn't generate a response. Please try rephrasing your question."
             else:
                 # Local safe fallback response
-                ai_response = (
-                    "I’m here to help explain your health data. While I can’t replace medical advice, "
-                    "here’s some general guidance based on your recent information. If you’re worried or "
-                    "have urgent symptoms, please contact your healthcare provider or emergency services."
-                )
+                ai_response = _FALLBACK_RESPONSE
             
             return {
                 "success": True,
                 "response": ai_response,
-                "model": settings.gemini_model if self._use_gemini else "local-fallback",
+                "model": self.model_name,
                 "timestamp": datetime.utcnow().isoformat()
             }
             
@@ -101,6 +149,79 @@ class GeminiChatService:
                 "timestamp": datetime.utcnow().isoformat()
             }
     
+    async def stream_chat_with_patient(
+        self,
+        message: str,
+        patient: Patient,
+        recent_vitals: List[Vitals] = None,
+        recent_risk_scores: List[RiskScore] = None,
+        chat_history: List[Dict] = None,
+        patient_name: str | None = None,
+    ) -> AsyncIterator[str]:
+        """
+        Stream the AI response for a patient question as text chunks.
+        
+        Same inputs as chat_with_patient; yields the response incrementally so
+        the client can render the first tokens before generation finishes.
+        """
+        full_prompt = self._build_full_prompt(
+            message, patient, recent_vitals, recent_risk_scores, chat_history, patient_name
+        )
+
+        if not self._use_gemini:
+            yield _FALLBACK_RESPONSE
+            return
+
+        response = await self.model.generate_content_async(
+            full_prompt,
+            generation_config=self._chat_generation_config(),
+            stream=True
+        )
+        async for chunk in response:
+            try:
+                text = chunk.text
+            except ValueError:
+                # Chunk without text parts (e.g. safety-filtered)
+                continue
+            if text:
+                yield text
+
+    @property
+    def model_name(self) -> str:
+        """Name of the model answering chat requests."""
+        return settings.gemini_model if self._use_gemini else "local-fallback"
+
+    def _chat_generation_config(self):
+        """Generation settings for patient chat responses."""
+        return genai.types.GenerationConfig(
+            temperature=0.7,
+            max_output_tokens=500,
+            top_p=0.8,
+            top_k=40
+        )
+
+    def _build_full_prompt(
+        self,
+        message: str,
+        patient: Patient,
+        recent_vitals: List[Vitals] = None,
+        recent_risk_scores: List[RiskScore] = None,
+        chat_history: List[Dict] = None,
+        patient_name: str | None = None,
+    ) -> str:
+        """Combine the system prompt with the conversation for a chat turn."""
+        # Build context prompt with patient data
+        system_prompt = self._build_system_prompt(
+            patient, recent_vitals, recent_risk_scores, patient_name=patient_name
+        )
+        
+        # Build conversation history
+        conversation_context = self._build_conversation_context(
+            chat_history, message
+        )
+        
+        return f"{system_prompt}\n\n{conversation_context}"
+    
     def _build_system_prompt(
         self,
         patient: Patient,
@@ -108,7 +229,52 @@ class GeminiChatService:
         recent_risk_scores: List[RiskScore] = None,
         patient_name: str | None = None,
     ) -> str:
-        """Build system prompt with patient context."""
+        """Build system prompt with patient context, reusing a cached render when possible."""
+        key = self._system_prompt_key(patient, recent_vitals, recent_risk_scores, patient_name)
+        if key is None:
+            return self._render_system_prompt(patient, recent_vitals, recent_risk_scores, patient_name)
+
+        cached = _prompt_cache.get(key)
+        if cached is not None:
+            _prompt_cache.move_to_end(key)
+            return cached
+
+        system_prompt = self._render_system_prompt(patient, recent_vitals, recent_risk_scores, patient_name)
+        _prompt_cache[key] = system_prompt
+        if len(_prompt_cache) > _PROMPT_CACHE_MAXSIZE:
+            _prompt_cache.popitem(last=False)
+        return system_prompt
+
+    @staticmethod
+    def _system_prompt_key(
+        patient: Patient,
+        recent_vitals: List[Vitals] = None,
+        recent_risk_scores: List[RiskScore] = None,
+        patient_name: str | None = None,
+    ) -> Optional[Tuple]:
+        """Cache key for a rendered system prompt, or None if the inputs are not persisted rows."""
+        patient_id = getattr(patient, "id", None)
+        vital_id = getattr(recent_vitals[0], "id", None) if recent_vitals else 0
+        risk_ids = tuple(getattr(r, "id", None) for r in recent_risk_scores or [])
+        if patient_id is None or vital_id is None or None in risk_ids:
+            return None
+        return (
+            patient_id,
+            getattr(patient, "updated_at", None),
+            vital_id,
+            risk_ids,
+            patient_name,
+            datetime.now().year,  # age is derived from the current year
+        )
+
+    def _render_system_prompt(
+        self,
+        patient: Patient,
+        recent_vitals: List[Vitals] = None,
+        recent_risk_scores: List[RiskScore] = None,
+        patient_name: str | None = None,
+    ) -> str:
+        """Render the system prompt from the patient's profile and recent data."""
         # Calculate patient age
         age = "unknown"
         if getattr(patient, "dob", None):
@@ -156,32 +322,15 @@ class GeminiChatService:
 
         name = patient_name or "Patient"
 
-        system_prompt = (
-            "You are a helpful medical AI assistant for HealthRevo, designed to help patients understand their health data and provide general health guidance.\n\n"
-            "IMPORTANT GUIDELINES:\n"
-            "- Always emphasize that you cannot replace professional medical advice\n"
-            "- For urgent symptoms or emergencies, direct patients to seek immediate medical care\n"
-            "- Provide educational information in simple, understandable language\n"
-            "- Be supportive and encouraging while being factually accurate\n"
-            "- If unsure about something, recommend consulting with their healthcare provider\n\n"
-            "PATIENT CONTEXT:\n"
-            f"- Name: {name}\n"
-            f"- Age: {age} years\n"
-            f"- Gender: {getattr(patient, 'gender', None) or 'Not specified'}\n"
-            f"- Blood group: {getattr(patient, 'blood_group', None) or 'Not specified'}\n\n"
-            "CURRENT HEALTH DATA:\n"
-            f"- {vitals_summary}\n"
-            f"- {risk_summary}\n\n"
-            "When answering questions:\n"
-            "1. Use the patient's health data to provide personalized context when relevant\n"
-            "2. Explain medical terms in simple language\n"
-            "3. Provide actionable, safe recommendations\n"
-            "4. Always remind patients to consult their healthcare provider for medical decisions\n"
-            "5. Be empathetic and supportive\n\n"
-            "Remember: You are an educational assistant, not a replacement for medical professionals."
-        )
-        return system_prompt
-    
+        return _SYSTEM_PREFIX + _DYNAMIC_TEMPLATE.format(
+            name=name,
+            age=age,
+            gender=getattr(patient, 'gender', None) or 'Not specified',
+            blood_group=getattr(patient, 'blood_group', None) or 'Not specified',
+            vitals=vitals_summary,
+            risk=risk_summary,
+        ) + _SYSTEM_SUFFIX
+
     def _build_conversation_context(
         self,
         chat_history: List[Dict] = None,
@@ -189,19 +338,16 @@ class GeminiChatService:
     ) -> str:
         """Build conversation context from chat history."""
         
-        context_parts = []
+        context_parts: List[str] = []
         
         # Add recent chat history (limit to last 5 exchanges)
         if chat_history:
-            recent_history = chat_history[-5:] if len(chat_history) > 5 else chat_history
-            
             context_parts.append("RECENT CONVERSATION:")
-            for entry in recent_history:
-                if entry.get("role") == "user":
-                    context_parts.append(f"Patient: {entry.get('content', '')}")
-                elif entry.get("role") == "assistant":
-                    context_parts.append(f"Assistant: {entry.get('content', '')}")
-            
+            context_parts.extend(
+                f"{_ROLE_LABELS[entry['role']]}: {entry.get('content', '')}"
+                for entry in chat_history[-5:]
+                if entry.get("role") in _ROLE_LABELS
+            )
             context_parts.append("")  # Add blank line
         
         # Add current message
@@ -249,3 +395,9 @@ Keep it under 200 words and focus on empowering the patient."""
             
         except Exception as e:
             return f"We're monitoring your health progress. Continue tracking your vitals and stay in touch with your healthcare provider."
+
+
+@lru_cache(maxsize=1)
+def get_chat_service() -> GeminiChatService:
+    """FastAPI dependency returning the shared chat service instance."""
+    return GeminiChatService()
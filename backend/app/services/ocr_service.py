@@ -9,6 +9,14 @@ from pdf2image import convert_from_path
 from app.config import settings
 
 
+# Fraction of dark pixels in the preprocessed page below which OCR is skipped, and
+# below which sparse-text segmentation is used instead. Only truly empty pages are
+# skipped: on a 300-dpi A4 page a single printed digit is ~1.6e-5 and a three-line
+# prescription ~0.003, while a couple of stray specks stay around 2e-6.
+BLANK_PAGE_INK_RATIO = 0.00001
+SPARSE_PAGE_INK_RATIO = 0.02
+
+
 class OCRService:
     """Optical Character Recognition service for prescription processing."""
     
@@ -86,6 +94,15 @@ class OCRService:
             # Preprocess image for better OCR results
             processed_image = self._preprocess_image(image)
             
+            # Skip Tesseract on blank pages
+            psm = self._select_psm(processed_image)
+            if psm is None:
+                return {
+                    "success": True,
+                    "text": "",
+                    "error": None
+                }
+            
             # Convert back to PIL Image for pytesseract
             processed_pil = Image.fromarray(processed_image)
             
@@ -93,7 +110,7 @@ class OCRService:
             extracted_text = pytesseract.image_to_string(
                 processed_pil,
                 lang='eng',
-                config='--psm 6'  # Assume uniform block of text
+                config=f'--psm {psm}'
             )
             
             return {
@@ -109,11 +126,26 @@ class OCRService:
                 "text": ""
             }
     
+    @staticmethod
+    def _select_psm(processed_image: np.ndarray) -> Optional[int]:
+        """Tesseract page segmentation mode for a preprocessed page, or None if it is blank."""
+        # Text pixels are dark after thresholding
+        ink_ratio = float((processed_image < 128).mean())
+        if ink_ratio < BLANK_PAGE_INK_RATIO:
+            return None
+        # Sparse pages: find scattered text (--psm 11) rather than assume a uniform block (--psm 6)
+        return 11 if ink_ratio < SPARSE_PAGE_INK_RATIO else 6
+    
     def _preprocess_image(self, image: np.ndarray) -> np.ndarray:
         """Preprocess image to improve OCR accuracy."""
         
+        # Run the pipeline on a UMat so OpenCV's T-API can dispatch to OpenCL
+        # and reuse intermediate buffers; falls back to the CPU path transparently
+        height, width = image.shape[:2]
+        umat = cv2.UMat(image)
+        
         # Convert to grayscale
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        gray = cv2.cvtColor(umat, cv2.COLOR_BGR2GRAY)
         
         # Apply Gaussian blur to reduce noise
         blurred = cv2.GaussianBlur(gray, (3, 3), 0)
@@ -128,14 +160,14 @@ class OCRService:
         cleaned = cv2.morphologyEx(thresh, cv2.MORPH_CLOSE, kernel)
         
         # Resize image for better OCR (if too small)
-        height, width = cleaned.shape
         if height < 300 or width < 300:
             scale_factor = max(300/height, 300/width)
             new_width = int(width * scale_factor)
             new_height = int(height * scale_factor)
             cleaned = cv2.resize(cleaned, (new_width, new_height), interpolation=cv2.INTER_CUBIC)
         
-        return cleaned
+        # Download back to a numpy array once, for PIL/Tesseract
+        return cleaned.get()
     
     def get_text_confidence(self, image_path: str) -> float:
         """Get OCR confidence score for the extracted text."""
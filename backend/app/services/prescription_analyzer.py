@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import List, Dict, Any, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, or_, func
+from sqlalchemy import select, func
 
 from app.models.drug_interaction import DrugInteraction
 
@@ -15,18 +15,25 @@ async def check_interactions(db: AsyncSession, meds: List[Dict[str, Any]]) -> Li
     names = [m.get("name", "").strip() for m in meds if m.get("name")]
     unique = list({n.lower(): n for n in names}.values())
     interactions: List[Dict[str, Any]] = []
-    # Check all pairs against DrugInteraction table (case-insensitive)
+    if len(unique) < 2:
+        return interactions
+
+    # Fetch every candidate interaction among these drugs in one round-trip on the caller's session
+    lowered = [n.lower() for n in unique]
+    stmt = select(DrugInteraction).where(
+        func.lower(DrugInteraction.drug_a).in_(lowered),
+        func.lower(DrugInteraction.drug_b).in_(lowered),
+    )
+    result = await db.execute(stmt)
+    by_pair: Dict[Tuple[str, str], DrugInteraction] = {}
+    for row in result.scalars():
+        by_pair.setdefault((row.drug_a.lower(), row.drug_b.lower()), row)
+
+    # Check all pairs against the fetched rows (case-insensitive, either direction)
     for i in range(len(unique)):
         for j in range(i + 1, len(unique)):
             a, b = unique[i], unique[j]
-            stmt = select(DrugInteraction).where(
-                or_(
-                    (func.lower(DrugInteraction.drug_a) == func.lower(a)) & (func.lower(DrugInteraction.drug_b) == func.lower(b)),
-                    (func.lower(DrugInteraction.drug_a) == func.lower(b)) & (func.lower(DrugInteraction.drug_b) == func.lower(a))
-                )
-            )
-            result = await db.execute(stmt)
-            match = result.scalar_one_or_none()
+            match = by_pair.get((a.lower(), b.lower())) or by_pair.get((b.lower(), a.lower()))
             if match:
                 interactions.append({
                     "drugA": a,
@@ -1,18 +1,89 @@
-from typing import List, Dict, Optional
+from typing import List, Dict, NamedTuple, Optional, Tuple, Union
+from collections import OrderedDict
 from datetime import datetime, timedelta
+import copy
 import statistics
+from sqlalchemy import select, func, case, and_
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.vitals import Vitals
 from app.config import settings
 
 
+class VitalsAggregate(NamedTuple):
+    """Per-patient vitals summary computed in SQL over the risk window."""
+    avg_systolic: Optional[float]
+    avg_diastolic: Optional[float]
+    avg_glucose: Optional[float]
+    max_glucose: Optional[float]
+    n_readings: int
+    bp_readings: int
+    glucose_readings: int
+
+
+def _as_float(value) -> Optional[float]:
+    return float(value) if value is not None else None
+
+
+async def aggregate_vitals(
+    db: AsyncSession,
+    patient_id: int,
+    window_days: Optional[int] = None,
+) -> VitalsAggregate:
+    """Aggregate a patient's recent vitals in a single query instead of loading every row."""
+    days = window_days if window_days is not None else settings.risk_calculation_window_days
+    since = datetime.utcnow() - timedelta(days=days)
+
+    # Mirror the list-based path: BP only counts when both readings are present
+    has_bp = and_(Vitals.systolic.isnot(None), Vitals.diastolic.isnot(None))
+    stmt = (
+        select(
+            func.avg(case((has_bp, Vitals.systolic))),
+            func.avg(case((has_bp, Vitals.diastolic))),
+            func.avg(Vitals.blood_glucose),
+            func.max(Vitals.blood_glucose),
+            func.count(),
+            func.count(case((has_bp, 1))),
+            func.count(Vitals.blood_glucose),
+        )
+        .where(Vitals.patient_id == patient_id)
+        .where(Vitals.recorded_at >= since)
+    )
+    row = (await db.execute(stmt)).one()
+    return VitalsAggregate(
+        avg_systolic=_as_float(row[0]),
+        avg_diastolic=_as_float(row[1]),
+        avg_glucose=_as_float(row[2]),
+        max_glucose=_as_float(row[3]),
+        n_readings=row[4] or 0,
+        bp_readings=row[5] or 0,
+        glucose_readings=row[6] or 0,
+    )
+
+
 class RiskCalculator:
     """Heuristic-based risk calculation engine."""
     
     @staticmethod
-    def calculate_hypertension_risk(vitals_list: List[Vitals]) -> Dict:
-        """Calculate hypertension risk based on blood pressure readings."""
+    def calculate_hypertension_risk(vitals: Union[List[Vitals], VitalsAggregate]) -> Dict:
+        """Calculate hypertension risk based on blood pressure readings.
+
+        Accepts either the raw vitals rows or a precomputed VitalsAggregate.
+        """
         
-        if not vitals_list:
+        if isinstance(vitals, VitalsAggregate):
+            total_readings = vitals.n_readings
+            readings_count = vitals.bp_readings
+        else:
+            total_readings = len(vitals) if vitals else 0
+            # Filter valid BP readings
+            bp_readings = [
+                (v.systolic, v.diastolic) 
+                for v in vitals or []
+                if v.systolic and v.diastolic
+            ]
+            readings_count = len(bp_readings)
+
+        if not total_readings:
             return {
                 "score": 0,
                 "risk_level": "low",
@@ -20,14 +91,7 @@ class RiskCalculator:
                 "confidence": 0
             }
         
-        # Filter valid BP readings
-        bp_readings = [
-            (v.systolic, v.diastolic) 
-            for v in vitals_list 
-            if v.systolic and v.diastolic
-        ]
-        
-        if not bp_readings:
+        if not readings_count:
             return {
                 "score": 0,
                 "risk_level": "low", 
@@ -36,11 +100,12 @@ class RiskCalculator:
             }
         
         # Calculate averages
-        systolic_values = [bp[0] for bp in bp_readings]
-        diastolic_values = [bp[1] for bp in bp_readings]
-        
-        avg_systolic = statistics.mean(systolic_values)
-        avg_diastolic = statistics.mean(diastolic_values)
+        if isinstance(vitals, VitalsAggregate):
+            avg_systolic = vitals.avg_systolic
+            avg_diastolic = vitals.avg_diastolic
+        else:
+            avg_systolic = statistics.mean(bp[0] for bp in bp_readings)
+            avg_diastolic = statistics.mean(bp[1] for bp in bp_readings)
         
         # Risk scoring based on AHA guidelines
         systolic_score = max(0, (avg_systolic - 120) * 1.2)
@@ -64,7 +129,7 @@ class RiskCalculator:
         drivers = {
             "avg_systolic": round(avg_systolic, 1),
             "avg_diastolic": round(avg_diastolic, 1),
-            "readings_count": len(bp_readings)
+            "readings_count": readings_count
         }
         
         if avg_systolic > 140:
@@ -73,7 +138,7 @@ class RiskCalculator:
             drivers["high_diastolic"] = True
         
         # Confidence based on data quality
-        confidence = min(100, len(bp_readings) * 20)  # More readings = higher confidence
+        confidence = min(100, readings_count * 20)  # More readings = higher confidence
         
         return {
             "score": round(score, 2),
@@ -84,16 +149,28 @@ class RiskCalculator:
         }
     
     @staticmethod
-    def calculate_diabetes_risk(vitals_list: List[Vitals]) -> Dict:
-        """Calculate diabetes risk based on blood glucose readings."""
+    def calculate_diabetes_risk(vitals: Union[List[Vitals], VitalsAggregate]) -> Dict:
+        """Calculate diabetes risk based on blood glucose readings.
+
+        Accepts either the raw vitals rows or a precomputed VitalsAggregate.
+        """
         
-        glucose_readings = [
-            v.blood_glucose 
-            for v in vitals_list 
-            if v.blood_glucose is not None
-        ]
+        if isinstance(vitals, VitalsAggregate):
+            readings_count = vitals.glucose_readings
+            avg_glucose = vitals.avg_glucose
+            max_glucose = vitals.max_glucose
+        else:
+            glucose_readings = [
+                float(v.blood_glucose)
+                for v in vitals or []
+                if v.blood_glucose is not None
+            ]
+            readings_count = len(glucose_readings)
+            if glucose_readings:
+                avg_glucose = statistics.mean(glucose_readings)
+                max_glucose = max(glucose_readings)
         
-        if not glucose_readings:
+        if not readings_count:
             return {
                 "score": 0,
                 "risk_level": "low",
@@ -101,9 +178,6 @@ class RiskCalculator:
                 "confidence": 0
             }
         
-        avg_glucose = statistics.mean(glucose_readings)
-        max_glucose = max(glucose_readings)
-        
         # Risk scoring based on ADA guidelines
         if avg_glucose < 100:
             score = 0
@@ -131,10 +205,10 @@ class RiskCalculator:
         drivers = {
             "avg_glucose": round(avg_glucose, 1),
             "max_glucose": round(max_glucose, 1),
-            "readings_count": len(glucose_readings)
+            "readings_count": readings_count
         }
         
-        confidence = min(100, len(glucose_readings) * 25)
+        confidence = min(100, readings_count * 25)
         
         return {
             "score": round(score, 2),
@@ -175,3 +249,39 @@ class RiskCalculator:
             recommendations.append("Review medication adherence")
         
         return recommendations
+
+
+# Risk results keyed by (patient_id, latest_vital_id, window_days, window_start_date).
+# A new vitals row bumps latest_vital_id, so inserts invalidate naturally; the
+# window start date lets entries expire as old readings fall out of the window.
+_RISK_CACHE_MAXSIZE = 10_000
+_risk_cache: "OrderedDict[Tuple, Dict[str, Dict]]" = OrderedDict()
+
+
+async def compute_patient_risks(
+    db: AsyncSession,
+    patient_id: int,
+    window_days: Optional[int] = None,
+) -> Dict[str, Dict]:
+    """Compute hypertension and diabetes risk for a patient, reusing cached results
+    while no new vitals have been recorded."""
+    days = window_days if window_days is not None else settings.risk_calculation_window_days
+    latest_vital_id = (
+        await db.execute(select(func.max(Vitals.id)).where(Vitals.patient_id == patient_id))
+    ).scalar()
+    key = (patient_id, latest_vital_id, days, (datetime.utcnow() - timedelta(days=days)).date())
+
+    cached = _risk_cache.get(key)
+    if cached is not None:
+        _risk_cache.move_to_end(key)
+        return copy.deepcopy(cached)
+
+    agg = await aggregate_vitals(db, patient_id, window_days=days)
+    results = {
+        "hypertension": RiskCalculator.calculate_hypertension_risk(agg),
+        "diabetes": RiskCalculator.calculate_diabetes_risk(agg),
+    }
+    _risk_cache[key] = results
+    if len(_risk_cache) > _RISK_CACHE_MAXSIZE:
+        _risk_cache.popitem(last=False)
+    return copy.deepcopy(results)
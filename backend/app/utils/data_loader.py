@@ -17,29 +17,119 @@ Run the seed script: python backend/scripts/seed_drug_interactions.py --csv back
 """
 from __future__ import annotations
 
-from typing import Iterable, Dict, Any, Optional
+from typing import Callable, Iterable, Iterator, Dict, Any, List, Optional, Sequence, Tuple
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import closing, contextmanager
+from functools import partial
 import csv
+import io
 import json
+import mmap
 import os
+import queue
 import sqlite3
+import sys
+import threading
+
+try:
+    import orjson
+except Exception:  # Optional speedup; stdlib json is used if unavailable
+    orjson = None
+from sqlalchemy import insert, inspect
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 from app.database import SessionLocal, Base, sync_engine
 from app.models.drug_interaction import DrugInteraction
 
+# SQLite pragmas relaxed while seeding: no fsync per commit, temp tables in memory.
+# journal_mode is left as-is: leaving WAL needs an exclusive lock, which fails while
+# any other connection (e.g. the running API) has the database open.
+_SQLITE_BULK_PRAGMAS: Dict[str, str] = {
+    "synchronous": "OFF",
+    "temp_store": "MEMORY",
+}
+
+# Rows per INSERT batch; override with the HEALTHREVO_SEED_BATCH env var or the batch_size argument.
+# Each batch runs as one executemany of a single-row INSERT, so the size bounds how many row
+# dicts are held in memory per call, not the bound parameters of any one statement.
+DEFAULT_BATCH_SIZE = 5000
+
+# Rows per transaction during bulk loads (bounds the in-memory journal on SQLite)
+_COMMIT_EVERY = 100_000
+
+# Target field -> accepted CSV header names (lowercased), in lookup order
+_COLUMN_ALIASES: Dict[str, Tuple[str, ...]] = {
+    "drug_a": ("drug_a", "a"),
+    "drug_b": ("drug_b", "b"),
+    "severity": ("severity",),
+    "description": ("description", "desc"),
+    "mechanism": ("mechanism",),
+    "clinical_management": ("clinical_management", "management"),
+    "drugbank_id_a": ("drugbank_id_a", "drugbank_a"),
+    "drugbank_id_b": ("drugbank_id_b", "drugbank_b"),
+    "drug_a_aliases": ("drug_a_aliases",),
+    "drug_b_aliases": ("drug_b_aliases",),
+}
+
+# Raw severity labels (lowercased) -> normalized severity; anything else is "moderate"
+_SEVERITY_MAP: Dict[str, str] = {
+    "minor": "minor",
+    "low": "minor",
+    "moderate": "moderate",
+    "medium": "moderate",
+    "major": "major",
+    "high": "major",
+    "contraindicated": "contraindicated",
+    "contra-indicated": "contraindicated",
+    "contra": "contraindicated",
+}
+
+# Same for the medi-co dataset ("Drug1"/"Drug1 ID", "Drug2"/"Drug2 ID", "Interaction")
+_MEDI_CO_COLUMN_ALIASES: Dict[str, Tuple[str, ...]] = {
+    "drug1": ("drug1", "drug1 id"),
+    "drug2": ("drug2", "drug2 id"),
+    "interaction": ("interaction",),
+}
+
+
+# Set by ensure_schema() once the tables have been created
+_TABLES_READY = False
+
+# Read size for CSVs that can't be memory-mapped
+_READ_BUFFER_BYTES = 64 * 1024 * 1024
+
+# Parallel medi-co parsing: files below the threshold are parsed inline; larger ones are split
+# into byte ranges parsed by worker processes, with at most _QUEUE_BATCHES parsed ranges
+# waiting for the writer at any time.
+_PARALLEL_MIN_BYTES = 8 * 1024 * 1024
+_RANGE_BYTES = 4 * 1024 * 1024
+_QUEUE_BATCHES = 8
+
+# Medi-co id -> name map, set once per worker process by _init_medi_co_worker
+_worker_id_to_name: Dict[str, str] = {}
+
+_DONE = object()
+
 
 def _norm_severity(s: Optional[str]) -> str:
-    if not s:
-        return "moderate"
-    s = s.strip().lower()
-    if s in {"minor", "low"}:
-        return "minor"
-    if s in {"moderate", "medium"}:
-        return "moderate"
-    if s in {"major", "high"}:
-        return "major"
-    if s in {"contraindicated", "contra-indicated", "contra"}:
-        return "contraindicated"
-    return "moderate"
+    return _SEVERITY_MAP.get(s.strip().lower(), "moderate") if s else "moderate"
+
+
+def _json_dumps(obj: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    # Match orjson's compact, non-ASCII-escaped output
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def _json_load_file(path: str) -> Any:
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
 
 
 def _to_json_or_text(v: Optional[str]) -> Optional[str]:
@@ -56,17 +146,27 @@ def _to_json_or_text(v: Optional[str]) -> Optional[str]:
     if not parts:
         parts = [p.strip() for p in v.split(",") if p.strip()]
     if parts:
-        return json.dumps(parts, ensure_ascii=False)
+        return _json_dumps(parts)
     return v
 
 
+def _first(r: Dict[str, Any], keys: Tuple[str, ...]) -> Any:
+    """First truthy value among the given keys."""
+    for k in keys:
+        v = r.get(k)
+        if v:
+            return v
+    return None
+
+
 def _prepare_row(row: Dict[str, Any]) -> Dict[str, Any]:
     # Normalize keys to lowercase for robustness
     r = {k.lower(): v for k, v in row.items()}
+    aliases = _COLUMN_ALIASES
 
-    drug_a = (r.get("drug_a") or r.get("a") or "").strip()
-    drug_b = (r.get("drug_b") or r.get("b") or "").strip()
-    description = (r.get("description") or r.get("desc") or "").strip()
+    drug_a = (_first(r, aliases["drug_a"]) or "").strip()
+    drug_b = (_first(r, aliases["drug_b"]) or "").strip()
+    description = (_first(r, aliases["description"]) or "").strip()
 
     if not drug_a or not drug_b or not description:
         raise ValueError("drug_a, drug_b, and description are required")
@@ -77,130 +177,500 @@ def _prepare_row(row: Dict[str, Any]) -> Dict[str, Any]:
         "severity": _norm_severity(r.get("severity")),
         "description": description,
         "mechanism": (r.get("mechanism") or "").strip() or None,
-        "clinical_management": (r.get("clinical_management") or r.get("management") or "").strip() or None,
-        "drugbank_id_a": (r.get("drugbank_id_a") or r.get("drugbank_a") or "").strip() or None,
-        "drugbank_id_b": (r.get("drugbank_id_b") or r.get("drugbank_b") or "").strip() or None,
+        "clinical_management": (_first(r, aliases["clinical_management"]) or "").strip() or None,
+        "drugbank_id_a": (_first(r, aliases["drugbank_id_a"]) or "").strip() or None,
+        "drugbank_id_b": (_first(r, aliases["drugbank_id_b"]) or "").strip() or None,
         "drug_a_aliases": _to_json_or_text(r.get("drug_a_aliases")),
         "drug_b_aliases": _to_json_or_text(r.get("drug_b_aliases")),
     }
     return payload
 
 
-def _bulk_insert(session, rows: Iterable[Dict[str, Any]], replace: bool = False, batch_size: int = 1000) -> int:
+def _column_indexes(header: Sequence[str], aliases: Dict[str, Tuple[str, ...]]) -> Dict[str, Tuple[int, ...]]:
+    """Resolve each target field to the positions of its accepted columns in a CSV header."""
+    positions: Dict[str, int] = {}
+    for i, name in enumerate(header):
+        positions.setdefault(name.strip().lower(), i)
+    return {field: tuple(positions[a] for a in names if a in positions) for field, names in aliases.items()}
+
+
+def _pick(row: Sequence[str], indexes: Tuple[int, ...]) -> Optional[str]:
+    """First non-empty value among the given column positions."""
+    for i in indexes:
+        if i < len(row) and row[i]:
+            return row[i]
+    return None
+
+
+def _field_reader(indexes: Tuple[int, ...]) -> Callable[[Sequence[str]], Optional[str]]:
+    """Reader for one target field, specialized on how many columns can supply it."""
+    if not indexes:
+        return lambda row: None
+    if len(indexes) == 1:
+        i = indexes[0]
+        return lambda row: (row[i] or None) if i < len(row) else None
+    return partial(_pick, indexes=indexes)
+
+
+def build_row_mapper(header: Sequence[str]) -> Callable[[Sequence[str]], Dict[str, Any]]:
+    """Build a function mapping csv.reader rows to DrugInteraction payloads.
+
+    Column aliases are resolved against `header` once; the returned function only does
+    indexed reads. Like _prepare_row, it raises ValueError for rows missing drug_a,
+    drug_b or description.
+    """
+    idx = _column_indexes(header, _COLUMN_ALIASES)
+    drug_a_of = _field_reader(idx["drug_a"])
+    drug_b_of = _field_reader(idx["drug_b"])
+    description_of = _field_reader(idx["description"])
+    severity_of = _field_reader(idx["severity"])
+    mechanism_of = _field_reader(idx["mechanism"])
+    management_of = _field_reader(idx["clinical_management"])
+    drugbank_a_of = _field_reader(idx["drugbank_id_a"])
+    drugbank_b_of = _field_reader(idx["drugbank_id_b"])
+    aliases_a_of = _field_reader(idx["drug_a_aliases"])
+    aliases_b_of = _field_reader(idx["drug_b_aliases"])
+
+    def map_row(row: Sequence[str]) -> Dict[str, Any]:
+        drug_a = (drug_a_of(row) or "").strip()
+        drug_b = (drug_b_of(row) or "").strip()
+        description = (description_of(row) or "").strip()
+
+        if not drug_a or not drug_b or not description:
+            raise ValueError("drug_a, drug_b, and description are required")
+
+        return {
+            "drug_a": drug_a,
+            "drug_b": drug_b,
+            "severity": _norm_severity(severity_of(row)),
+            "description": description,
+            "mechanism": (mechanism_of(row) or "").strip() or None,
+            "clinical_management": (management_of(row) or "").strip() or None,
+            "drugbank_id_a": (drugbank_a_of(row) or "").strip() or None,
+            "drugbank_id_b": (drugbank_b_of(row) or "").strip() or None,
+            "drug_a_aliases": _to_json_or_text(aliases_a_of(row)),
+            "drug_b_aliases": _to_json_or_text(aliases_b_of(row)),
+        }
+
+    return map_row
+
+
+def ensure_schema() -> None:
+    """Create missing tables once per process; later calls are no-ops."""
+    global _TABLES_READY
+    if not _TABLES_READY:
+        Base.metadata.create_all(bind=sync_engine)
+        _TABLES_READY = True
+
+
+def _resolve_batch_size(batch_size: Optional[int] = None) -> int:
+    """Explicit batch_size, else HEALTHREVO_SEED_BATCH, else DEFAULT_BATCH_SIZE."""
+    if batch_size is None:
+        raw = os.getenv("HEALTHREVO_SEED_BATCH")
+        if not raw:
+            return DEFAULT_BATCH_SIZE
+        try:
+            batch_size = int(raw)
+        except ValueError:
+            raise ValueError(f"HEALTHREVO_SEED_BATCH must be a positive integer, got {raw!r}") from None
+    return max(1, batch_size)
+
+
+@contextmanager
+def _open_csv_lines(path: str) -> Iterator[Iterable[str]]:
+    """Lines of a UTF-8 CSV for csv.reader, read from a memory map of the file.
+
+    Falls back to a buffered text read (_READ_BUFFER_BYTES at a time) when the file
+    can't be mapped, e.g. empty files or filesystems without mmap support.
+    """
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            mm = None
+    if mm is None:
+        with open(path, "r", encoding="utf-8", newline="", buffering=_READ_BUFFER_BYTES) as tf:
+            yield tf
+        return
+    with mm:
+        yield (line.decode("utf-8") for line in iter(mm.readline, b""))
+
+
+@contextmanager
+def _bulk_session() -> Iterator[Any]:
+    """Session for bulk loads. On SQLite the durability pragmas are relaxed on a
+    dedicated connection for the duration of the load and restored afterwards."""
+    # Bulk loads never read back what they insert: skip autoflush and post-commit expiry
+    if sync_engine.dialect.name != "sqlite":
+        with SessionLocal(autoflush=False, expire_on_commit=False) as session:
+            yield session
+        return
+
+    with sync_engine.connect() as conn:
+        saved = {name: conn.exec_driver_sql(f"PRAGMA {name}").scalar() for name in _SQLITE_BULK_PRAGMAS}
+        for name, value in _SQLITE_BULK_PRAGMAS.items():
+            conn.exec_driver_sql(f"PRAGMA {name}={value}")
+        conn.commit()
+        try:
+            with SessionLocal(bind=conn, autoflush=False, expire_on_commit=False) as session:
+                yield session
+        finally:
+            conn.rollback()
+            for name, value in saved.items():
+                conn.exec_driver_sql(f"PRAGMA {name}={value}")
+            conn.commit()
+
+
+def _insert_statement(bind):
+    """INSERT that skips pairs already present (ON CONFLICT DO NOTHING) where the dialect supports it.
+
+    Tables created before the unique (drug_a, drug_b) index existed get a plain INSERT
+    until the migration is applied.
+    """
+    table = DrugInteraction.__table__
+    has_pair_index = any(
+        ix["unique"] and ix["column_names"] == ["drug_a", "drug_b"]
+        for ix in inspect(bind).get_indexes(table.name)
+    )
+    if not has_pair_index:
+        return insert(table)
+    dialect = bind.dialect.name
+    if dialect == "sqlite":
+        return sqlite_insert(table).on_conflict_do_nothing(index_elements=["drug_a", "drug_b"])
+    if dialect == "postgresql":
+        return pg_insert(table).on_conflict_do_nothing(index_elements=["drug_a", "drug_b"])
+    return insert(table)
+
+
+def _execute_batch(session, stmt, batch: List[Dict[str, Any]]) -> int:
+    rowcount = session.execute(stmt, batch).rowcount
+    # Drivers that can't report executemany rowcounts return -1
+    return rowcount if rowcount >= 0 else len(batch)
+
+
+def _bulk_insert(
+    session,
+    rows: Iterable[Any],
+    replace: bool = False,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    prepare: Optional[Callable[[Any], Dict[str, Any]]] = _prepare_row,
+) -> int:
+    """Insert rows in batches. `prepare` turns a source row into a column payload
+    (raising ValueError to skip it); pass None when rows are already payloads.
+
+    Everything goes in as one transaction, committed every _COMMIT_EVERY rows and at the end.
+    Rows whose (drug_a, drug_b) pair already exists are skipped, so re-seeding without
+    `replace` is idempotent. Returns the number of rows actually inserted.
+    """
     if replace:
         session.query(DrugInteraction).delete()
-        session.commit()
 
+    # Core INSERT with a list of dicts: one executemany of a single-row INSERT per batch, no ORM objects
+    stmt = _insert_statement(session.connection())
     count = 0
-    batch: list[DrugInteraction] = []
+    uncommitted = 0
+    # Fixed-size buffer filled by index and reused for every batch
+    buf: List[Any] = [None] * batch_size
+    n = 0
     for r in rows:
-        try:
-            payload = _prepare_row(r)
-        except ValueError:
-            # Skip invalid rows
-            continue
-        batch.append(DrugInteraction(**payload))
-        if len(batch) >= batch_size:
-            session.bulk_save_objects(batch)
-            session.commit()
-            count += len(batch)
-            batch.clear()
-    if batch:
-        session.bulk_save_objects(batch)
-        session.commit()
-        count += len(batch)
+        if prepare is None:
+            payload = r
+        else:
+            try:
+                payload = prepare(r)
+            except ValueError:
+                # Skip invalid rows
+                continue
+        buf[n] = payload
+        n += 1
+        if n == batch_size:
+            count += _execute_batch(session, stmt, buf)
+            uncommitted += n
+            n = 0
+            if uncommitted >= _COMMIT_EVERY:
+                session.commit()
+                uncommitted = 0
+    if n:
+        count += _execute_batch(session, stmt, buf[:n])
+    session.commit()
     return count
 
 
-def load_drug_interactions_from_csv(csv_path: str, replace: bool = False) -> int:
+def load_drug_interactions_from_csv(
+    csv_path: str,
+    replace: bool = False,
+    compat: bool = False,
+    batch_size: Optional[int] = None,
+) -> int:
     """Load drug interactions from a CSV file into the database.
 
+    Rows are read with csv.reader and fields pulled by header position; pass
+    compat=True to fall back to the original csv.DictReader path. batch_size
+    defaults to HEALTHREVO_SEED_BATCH or DEFAULT_BATCH_SIZE.
+
     Returns number of rows inserted.
     """
     if not os.path.exists(csv_path):
         raise FileNotFoundError(csv_path)
 
-    # Ensure tables exist
-    Base.metadata.create_all(bind=sync_engine)
-
-    with SessionLocal() as session:
-        with open(csv_path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            count = _bulk_insert(session, reader, replace=replace)
+    ensure_schema()
+    batch_size = _resolve_batch_size(batch_size)
+
+    with _bulk_session() as session:
+        if compat:
+            with open(csv_path, "r", encoding="utf-8", newline="") as f:
+                count = _bulk_insert(session, csv.DictReader(f), replace=replace, batch_size=batch_size)
+        else:
+            with _open_csv_lines(csv_path) as lines:
+                reader = csv.reader(lines)
+                map_row = build_row_mapper(next(reader, []))
+                count = _bulk_insert(session, reader, replace=replace, batch_size=batch_size, prepare=map_row)
     return count
 
 
-def load_drug_interactions_from_sqlite(sqlite_path: str, table: str = "drug_interactions", replace: bool = False) -> int:
+def load_drug_interactions_from_sqlite(
+    sqlite_path: str,
+    table: str = "drug_interactions",
+    replace: bool = False,
+    batch_size: Optional[int] = None,
+) -> int:
     """Load drug interactions from an external SQLite file/table.
     The source table should have columns that map to the expected CSV headers.
+    Rows are streamed from the source cursor while inserting.
     """
     if not os.path.exists(sqlite_path):
         raise FileNotFoundError(sqlite_path)
 
-    Base.metadata.create_all(bind=sync_engine)
+    ensure_schema()
 
-    with sqlite3.connect(sqlite_path) as conn:
+    with closing(sqlite3.connect(sqlite_path)) as conn:
         conn.row_factory = sqlite3.Row
-        cur = conn.cursor()
-        cur.execute(f"SELECT * FROM {table}")
-        rows = [dict(r) for r in cur.fetchall()]
-
-    with SessionLocal() as session:
-        count = _bulk_insert(session, rows, replace=replace)
+        # ~200 MB page cache for the source scan
+        conn.execute("PRAGMA cache_size=-200000")
+        cur = conn.execute(f"SELECT * FROM {table}")
+        # Stream rows off the cursor instead of materializing the whole table
+        with _bulk_session() as session:
+            count = _bulk_insert(
+                session, (dict(r) for r in cur), replace=replace, batch_size=_resolve_batch_size(batch_size)
+            )
     return count
 
 
-def load_drug_interactions_from_medi_co_dataset(csv_path: str, synonyms_json_path: str, replace: bool = False) -> int:
+def _medi_co_payload(id_to_name: Dict[str, str], id1: str, id2: str, desc: str) -> Optional[Dict[str, Any]]:
+    if not id1 or not id2 or not desc:
+        return None
+    # Clean Compound:: prefix
+    id1 = id1.removeprefix("Compound::")
+    id2 = id2.removeprefix("Compound::")
+    # Names in id_to_name are already stripped; unknown ids fall back to themselves
+    try:
+        name1 = id_to_name[id1]
+    except KeyError:
+        name1 = id1.strip()
+    try:
+        name2 = id_to_name[id2]
+    except KeyError:
+        name2 = id2.strip()
+    if not name1 or not name2:
+        return None
+    return {
+        "drug_a": name1,
+        "drug_b": name2,
+        "severity": "moderate",
+        "description": desc,
+        "mechanism": None,
+        "clinical_management": None,
+        "drugbank_id_a": id1,
+        "drugbank_id_b": id2,
+        "drug_a_aliases": None,
+        "drug_b_aliases": None,
+    }
+
+
+def _build_id_to_name(synonyms: Dict[str, Any]) -> Dict[str, str]:
+    """DrugBank id (without 'Compound::') -> primary name, stripped and interned.
+
+    Names repeat across ids, so interning keeps one copy of each string.
+    """
+    id_to_name: Dict[str, str] = {}
+    for k, v in synonyms.items():
+        k = str(k)
+        name = v[0] if isinstance(v, list) and v else k
+        id_to_name[sys.intern(k.removeprefix("Compound::"))] = sys.intern(name.strip())
+    return id_to_name
+
+
+def _iter_medi_co_rows(
+    rows: Iterable[Sequence[str]], idx: Dict[str, Tuple[int, ...]], id_to_name: Dict[str, str]
+) -> Iterator[Dict[str, Any]]:
+    idx1, idx2, idx_desc = idx["drug1"], idx["drug2"], idx["interaction"]
+    for row in rows:
+        payload = _medi_co_payload(
+            id_to_name,
+            (_pick(row, idx1) or "").strip(),
+            (_pick(row, idx2) or "").strip(),
+            (_pick(row, idx_desc) or "").strip(),
+        )
+        if payload:
+            yield payload
+
+
+def _line_ranges(path: str, start: int, chunk_bytes: int) -> List[Tuple[int, int]]:
+    """Split [start, EOF) into byte ranges that end on line boundaries."""
+    size = os.path.getsize(path)
+    ranges: List[Tuple[int, int]] = []
+    with open(path, "rb") as f:
+        while start < size:
+            f.seek(min(start + chunk_bytes, size))
+            f.readline()
+            end = f.tell()
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def _init_medi_co_worker(id_to_name: Dict[str, str]) -> None:
+    global _worker_id_to_name
+    _worker_id_to_name = id_to_name
+
+
+def _parse_medi_co_range(csv_path: str, start: int, end: int, idx: Dict[str, Tuple[int, ...]]) -> List[Dict[str, Any]]:
+    """Worker: parse one byte range of the medi-co CSV into insert payloads."""
+    with open(csv_path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+    reader = csv.reader(io.StringIO(data.decode("utf-8"), newline=""))
+    return list(_iter_medi_co_rows(reader, idx, _worker_id_to_name))
+
+
+def _drain(q: "queue.Queue[Any]") -> Iterator[Dict[str, Any]]:
+    while True:
+        item = q.get()
+        if item is _DONE:
+            return
+        if isinstance(item, BaseException):
+            raise item
+        yield from item
+
+
+def _insert_medi_co_parallel(
+    session,
+    csv_path: str,
+    id_to_name: Dict[str, str],
+    workers: int,
+    replace: bool,
+    batch_size: int,
+) -> int:
+    """Parse byte ranges in worker processes and insert from this thread.
+
+    A producer thread keeps up to 2 * workers ranges in flight and hands parsed ranges
+    to a bounded queue in file order; the session stays on the calling thread.
+    Assumes one record per line (no quoted newlines), as in the medi-co CSV.
+    """
+    with open(csv_path, "rb") as f:
+        header_line = f.readline()
+        header_end = f.tell()
+    header = next(csv.reader([header_line.decode("utf-8")]), [])
+    idx = _column_indexes(header, _MEDI_CO_COLUMN_ALIASES)
+    ranges = _line_ranges(csv_path, header_end, _RANGE_BYTES)
+
+    q: "queue.Queue[Any]" = queue.Queue(maxsize=_QUEUE_BATCHES)
+    stop = threading.Event()
+
+    def _produce() -> None:
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_medi_co_worker, initargs=(id_to_name,)
+            ) as pool:
+                pending: deque = deque()
+                todo = iter(ranges)
+                for start, end in todo:
+                    pending.append(pool.submit(_parse_medi_co_range, csv_path, start, end, idx))
+                    if len(pending) >= 2 * workers:
+                        break
+                while pending and not stop.is_set():
+                    payloads = pending.popleft().result()
+                    nxt = next(todo, None)
+                    if nxt is not None:
+                        pending.append(pool.submit(_parse_medi_co_range, csv_path, nxt[0], nxt[1], idx))
+                    q.put(payloads)
+                pool.shutdown(cancel_futures=True)
+        except BaseException as e:
+            q.put(e)
+        finally:
+            q.put(_DONE)
+
+    producer = threading.Thread(target=_produce, name="medi-co-parser", daemon=True)
+    producer.start()
+    try:
+        return _bulk_insert(session, _drain(q), replace=replace, batch_size=batch_size, prepare=None)
+    finally:
+        # Unblock the producer if the writer stopped early
+        stop.set()
+        while producer.is_alive():
+            try:
+                q.get(timeout=0.1)
+            except queue.Empty:
+                pass
+        producer.join()
+
+
+def load_drug_interactions_from_medi_co_dataset(
+    csv_path: str,
+    synonyms_json_path: str,
+    replace: bool = False,
+    compat: bool = False,
+    batch_size: Optional[int] = None,
+    workers: Optional[int] = None,
+) -> int:
     """Load drug interactions from medi-co style dataset:
     - csv_path: CSV with columns Drug1, Drug2 (or Drug1 ID/Drug2 ID), and Interaction
     - synonyms_json_path: JSON mapping { drugbank_id: [names...] }
 
     We map DrugBank IDs to a primary name (first in the synonyms list), clean 'Compound::' prefix,
     and store as DrugInteraction with default 'moderate' severity.
+    Pass compat=True to read the CSV with csv.DictReader instead of by column position.
+    CSVs of _PARALLEL_MIN_BYTES or more are parsed by `workers` processes (default: CPU count);
+    workers=1 keeps everything on the calling thread.
     """
     if not os.path.exists(csv_path):
         raise FileNotFoundError(csv_path)
     if not os.path.exists(synonyms_json_path):
         raise FileNotFoundError(synonyms_json_path)
 
-    Base.metadata.create_all(bind=sync_engine)
+    ensure_schema()
+    batch_size = _resolve_batch_size(batch_size)
+    if workers is None:
+        workers = os.cpu_count() or 1
 
     # Load synonyms
-    with open(synonyms_json_path, "r", encoding="utf-8") as f:
-        synonyms = json.load(f)
-    id_to_name: Dict[str, str] = {str(k): (v[0] if isinstance(v, list) and v else str(k)) for k, v in synonyms.items()}
+    synonyms = _json_load_file(synonyms_json_path)
+    id_to_name = _build_id_to_name(synonyms)
 
     # Stream CSV and build rows
     def _iter_rows():
-        with open(csv_path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for r in reader:
+        if not compat:
+            with _open_csv_lines(csv_path) as lines:
+                reader = csv.reader(lines)
+                idx = _column_indexes(next(reader, []), _MEDI_CO_COLUMN_ALIASES)
+                yield from _iter_medi_co_rows(reader, idx, id_to_name)
+            return
+
+        with open(csv_path, "r", encoding="utf-8", newline="") as f:
+            for r in csv.DictReader(f):
                 # Accept both original and renamed columns
-                id1 = (r.get("Drug1") or r.get("Drug1 ID") or r.get("drug1") or r.get("drug1 id") or "").strip()
-                id2 = (r.get("Drug2") or r.get("Drug2 ID") or r.get("drug2") or r.get("drug2 id") or "").strip()
-                desc = (r.get("Interaction") or r.get("interaction") or "").strip()
-                if not id1 or not id2 or not desc:
-                    continue
-                # Clean Compound:: prefix
-                if id1.startswith("Compound::"):
-                    id1 = id1.split("::", 1)[1]
-                if id2.startswith("Compound::"):
-                    id2 = id2.split("::", 1)[1]
-                name1 = id_to_name.get(id1, id1)
-                name2 = id_to_name.get(id2, id2)
-                yield {
-                    "drug_a": name1,
-                    "drug_b": name2,
-                    "severity": "moderate",
-                    "description": desc,
-                    "mechanism": None,
-                    "clinical_management": None,
-                    "drugbank_id_a": id1,
-                    "drugbank_id_b": id2,
-                    "drug_a_aliases": None,
-                    "drug_b_aliases": None,
-                }
-
-    with SessionLocal() as session:
-        count = _bulk_insert(session, _iter_rows(), replace=replace)
+                payload = _medi_co_payload(
+                    id_to_name,
+                    (r.get("Drug1") or r.get("Drug1 ID") or r.get("drug1") or r.get("drug1 id") or "").strip(),
+                    (r.get("Drug2") or r.get("Drug2 ID") or r.get("drug2") or r.get("drug2 id") or "").strip(),
+                    (r.get("Interaction") or r.get("interaction") or "").strip(),
+                )
+                if payload:
+                    yield payload
+
+    with _bulk_session() as session:
+        if not compat and workers > 1 and os.path.getsize(csv_path) >= _PARALLEL_MIN_BYTES:
+            count = _insert_medi_co_parallel(session, csv_path, id_to_name, workers, replace, batch_size)
+        else:
+            count = _bulk_insert(session, _iter_rows(), replace=replace, batch_size=batch_size, prepare=None)
     return count
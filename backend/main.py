@@ -1,10 +1,27 @@
 """
 HealthRevo API Backend - Main Application
 """
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
+from functools import lru_cache
+import hmac
+import json
 import os
 import random
+import re
+
+try:
+    import orjson
+except Exception:  # Optional speedup; stdlib json is used if unavailable
+    orjson = None
+
+
+def _dumps(obj) -> bytes:
+    """Serialize a constant payload once so handlers can return the bytes as-is."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
 
 # Create FastAPI app
 app = FastAPI(
@@ -13,6 +30,7 @@ app = FastAPI(
     description="AI-powered health monitoring and prescription analysis system",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse if orjson is not None else JSONResponse,
 )
 
 # Setup CORS
@@ -49,43 +67,49 @@ async def health_check():
     }
 
 # Authentication endpoints
+def _login_response(access_token: str, user_id: int, email: str, full_name: str, role: str) -> dict:
+    return {
+        "access_token": access_token,
+        "token_type": "bearer",
+        "user": {
+            "id": user_id,
+            "email": email,
+            "fullName": full_name,
+            "role": role
+        }
+    }
+
+# Test with seeded users: email -> (password, prebuilt login response)
+_USERS = {
+    "doctor@healthrevo.com": (
+        b"doctor123",
+        _login_response("test_doctor_token", 1, "doctor@healthrevo.com", "Dr. Sarah Johnson", "doctor"),
+    ),
+    "john.doe@email.com": (
+        b"patient123",
+        _login_response("test_patient_2_token", 2, "john.doe@email.com", "John Doe", "patient"),
+    ),
+    "jane.smith@email.com": (
+        b"patient123",
+        _login_response("test_patient_3_token", 3, "jane.smith@email.com", "Jane Smith", "patient"),
+    ),
+    "mike.wilson@email.com": (
+        b"patient123",
+        _login_response("test_patient_4_token", 4, "mike.wilson@email.com", "Mike Wilson", "patient"),
+    ),
+}
+
 @app.post("/auth/login")
 async def login(credentials: dict):
     """Login endpoint"""
     email = credentials.get("email", "")
     password = credentials.get("password", "")
     
-    # Test with seeded users
-    if email == "doctor@healthrevo.com" and password == "doctor123":
-        return {
-            "access_token": "test_doctor_token",
-            "token_type": "bearer",
-            "user": {
-                "id": 1,
-                "email": email,
-                "fullName": "Dr. Sarah Johnson",
-                "role": "doctor"
-            }
-        }
-    elif password == "patient123" and email in ["john.doe@email.com", "jane.smith@email.com", "mike.wilson@email.com"]:
-        user_map = {
-            "john.doe@email.com": {"id": 2, "fullName": "John Doe"},
-            "jane.smith@email.com": {"id": 3, "fullName": "Jane Smith"},
-            "mike.wilson@email.com": {"id": 4, "fullName": "Mike Wilson"}
-        }
-        user_data = user_map[email]
-        return {
-            "access_token": f"test_patient_{user_data['id']}_token",
-            "token_type": "bearer",
-            "user": {
-                "id": user_data["id"],
-                "email": email,
-                "fullName": user_data["fullName"],
-                "role": "patient"
-            }
-        }
-    else:
-        raise HTTPException(status_code=401, detail="Invalid credentials")
+    entry = _USERS.get(email) if isinstance(email, str) else None
+    # Constant-time comparison on the encoded password
+    if entry and isinstance(password, str) and hmac.compare_digest(entry[0], password.encode("utf-8")):
+        return entry[1]
+    raise HTTPException(status_code=401, detail="Invalid credentials")
 
 # Patient endpoints
 @app.get("/patients/me")
@@ -102,37 +126,42 @@ async def get_current_patient():
         "medicalHistory": "No major medical history"
     }
 
+# Mock vitals; patientId is filled in per request
+_VITALS_PAYLOAD = (
+    {
+        "id": 1,
+        "recordedAt": "2025-09-12T23:44:29",
+        "systolic": 120,
+        "diastolic": 80,
+        "heartRate": 72,
+        "temperature": 98.6,
+        "bloodGlucose": 95,
+        "oxygenSaturation": 98,
+        "weight": 70.5,
+        "notes": "Normal readings"
+    },
+    {
+        "id": 2,
+        "recordedAt": "2025-09-13T23:44:29",
+        "systolic": 125,
+        "diastolic": 82,
+        "heartRate": 75,
+        "temperature": 98.4,
+        "bloodGlucose": 92,
+        "oxygenSaturation": 97,
+        "weight": 70.3,
+        "notes": "Slightly elevated blood pressure"
+    }
+)
+
+@lru_cache(maxsize=1024)
+def _vitals_json(patient_id: int) -> bytes:
+    return _dumps([{"id": v["id"], "patientId": patient_id, **v} for v in _VITALS_PAYLOAD])
+
 @app.get("/patients/{patient_id}/vitals")
 async def get_patient_vitals(patient_id: int):
     """Get patient vitals"""
-    return [
-        {
-            "id": 1,
-            "patientId": patient_id,
-            "recordedAt": "2025-09-12T23:44:29",
-            "systolic": 120,
-            "diastolic": 80,
-            "heartRate": 72,
-            "temperature": 98.6,
-            "bloodGlucose": 95,
-            "oxygenSaturation": 98,
-            "weight": 70.5,
-            "notes": "Normal readings"
-        },
-        {
-            "id": 2,
-            "patientId": patient_id,
-            "recordedAt": "2025-09-13T23:44:29",
-            "systolic": 125,
-            "diastolic": 82,
-            "heartRate": 75,
-            "temperature": 98.4,
-            "bloodGlucose": 92,
-            "oxygenSaturation": 97,
-            "weight": 70.3,
-            "notes": "Slightly elevated blood pressure"
-        }
-    ]
+    return Response(content=_vitals_json(patient_id), media_type="application/json")
 
 @app.post("/patients/{patient_id}/vitals")
 async def add_patient_vitals(patient_id: int, vitals: dict):
@@ -146,47 +175,50 @@ async def add_patient_vitals(patient_id: int, vitals: dict):
     }
 
 # Alerts endpoints
+_ALERTS_PAYLOAD = (
+    {
+        "id": 1,
+        "patientId": 2,
+        "type": "high_blood_pressure",
+        "severity": "medium",
+        "title": "High Blood Pressure Alert",
+        "message": "Blood pressure reading of 140/90 detected",
+        "resolved": False,
+        "generatedAt": "2025-09-13T23:44:29",
+        "acknowledged": False,
+        "metadata": {"systolic": 140, "diastolic": 90}
+    },
+    {
+        "id": 2,
+        "patientId": 2,
+        "type": "appointment_reminder",
+        "severity": "low",
+        "title": "Appointment Reminder",
+        "message": "Upcoming appointment in 2 days",
+        "resolved": False,
+        "generatedAt": "2025-09-13T23:44:29",
+        "acknowledged": False,
+        "metadata": {"appointment_date": "2025-09-15"}
+    },
+    {
+        "id": 3,
+        "patientId": 2,
+        "type": "medication_reminder",
+        "severity": "medium",
+        "title": "Medication Reminder",
+        "message": "Time to take your evening medication",
+        "resolved": False,
+        "generatedAt": "2025-09-13T20:00:00",
+        "acknowledged": False,
+        "metadata": {"medication": "Lisinopril 10mg"}
+    }
+)
+_ALERTS_JSON = _dumps(_ALERTS_PAYLOAD)
+
 @app.get("/alerts")
 async def get_alerts():
     """Get alerts"""
-    return [
-        {
-            "id": 1,
-            "patientId": 2,
-            "type": "high_blood_pressure",
-            "severity": "medium",
-            "title": "High Blood Pressure Alert",
-            "message": "Blood pressure reading of 140/90 detected",
-            "resolved": False,
-            "generatedAt": "2025-09-13T23:44:29",
-            "acknowledged": False,
-            "metadata": {"systolic": 140, "diastolic": 90}
-        },
-        {
-            "id": 2,
-            "patientId": 2,
-            "type": "appointment_reminder",
-            "severity": "low",
-            "title": "Appointment Reminder",
-            "message": "Upcoming appointment in 2 days",
-            "resolved": False,
-            "generatedAt": "2025-09-13T23:44:29",
-            "acknowledged": False,
-            "metadata": {"appointment_date": "2025-09-15"}
-        },
-        {
-            "id": 3,
-            "patientId": 2,
-            "type": "medication_reminder",
-            "severity": "medium",
-            "title": "Medication Reminder",
-            "message": "Time to take your evening medication",
-            "resolved": False,
-            "generatedAt": "2025-09-13T20:00:00",
-            "acknowledged": False,
-            "metadata": {"medication": "Lisinopril 10mg"}
-        }
-    ]
+    return Response(content=_ALERTS_JSON, media_type="application/json")
 
 @app.patch("/alerts/{alert_id}")
 async def update_alert(alert_id: int, update_data: dict):
@@ -199,41 +231,39 @@ async def update_alert(alert_id: int, update_data: dict):
     }
 
 # Chat endpoints
+# Simple mock responses based on message content
+_CHAT_RESPONSES = {
+    "blood pressure": "Your recent blood pressure readings show some elevation. I recommend monitoring daily and discussing with your doctor if it remains high.",
+    "medication": "It's important to take medications as prescribed. If you're experiencing side effects, please consult your healthcare provider.",
+    "vitals": "Your vital signs are being monitored. Recent trends show stable readings with minor fluctuations that are within normal ranges.",
+    "appointment": "Your next appointment is scheduled soon. Make sure to prepare any questions you have for your doctor.",
+    "diet": "Maintaining a healthy diet can significantly impact your health metrics. Consider reducing sodium intake for better blood pressure control.",
+    "exercise": "Regular physical activity can help improve your overall health and manage conditions like high blood pressure.",
+    "symptoms": "If you're experiencing unusual symptoms, please monitor them and contact your healthcare provider if they persist or worsen.",
+}
+_DEFAULT_CHAT_RESPONSES = (
+    "I understand your concern about your health. Based on your recent vitals, I can help provide general guidance.",
+    "Your health metrics are being monitored continuously. Is there a specific aspect you'd like to discuss?",
+    "I'm here to help you understand your health data. What specific information would you like to know about?",
+    "Based on your recent readings, I can provide insights about your health trends. What would you like to focus on?",
+    "I can help explain your health metrics and provide general wellness advice. What's your main concern today?"
+)
+# All keywords in one pass over the message
+_KEYWORD_RE = re.compile("|".join(map(re.escape, _CHAT_RESPONSES)))
+_KEYWORD_PRIORITY = {keyword: i for i, keyword in enumerate(_CHAT_RESPONSES)}
+
 @app.post("/patients/{patient_id}/chat")
 async def chat_with_ai(patient_id: int, message_data: dict):
     """Chat with AI assistant"""
     user_message = message_data.get("message", "")
     
-    # Simple mock responses based on message content
-    responses = {
-        "blood pressure": "Your recent blood pressure readings show some elevation. I recommend monitoring daily and discussing with your doctor if it remains high.",
-        "medication": "It's important to take medications as prescribed. If you're experiencing side effects, please consult your healthcare provider.",
-        "vitals": "Your vital signs are being monitored. Recent trends show stable readings with minor fluctuations that are within normal ranges.",
-        "appointment": "Your next appointment is scheduled soon. Make sure to prepare any questions you have for your doctor.",
-        "diet": "Maintaining a healthy diet can significantly impact your health metrics. Consider reducing sodium intake for better blood pressure control.",
-        "exercise": "Regular physical activity can help improve your overall health and manage conditions like high blood pressure.",
-        "symptoms": "If you're experiencing unusual symptoms, please monitor them and contact your healthcare provider if they persist or worsen.",
-        "default": [
-            "I understand your concern about your health. Based on your recent vitals, I can help provide general guidance.",
-            "Your health metrics are being monitored continuously. Is there a specific aspect you'd like to discuss?",
-            "I'm here to help you understand your health data. What specific information would you like to know about?",
-            "Based on your recent readings, I can provide insights about your health trends. What would you like to focus on?",
-            "I can help explain your health metrics and provide general wellness advice. What's your main concern today?"
-        ]
-    }
-    
-    # Check for keywords in user message
-    response = None
-    user_message_lower = user_message.lower()
-    
-    for keyword, keyword_response in responses.items():
-        if keyword != "default" and keyword in user_message_lower:
-            response = keyword_response
-            break
-    
-    # Use default responses if no keyword matched
-    if not response:
-        response = random.choice(responses["default"])
+    # Check for keywords in user message; earlier entries in _CHAT_RESPONSES win
+    keywords = _KEYWORD_RE.findall(user_message.lower())
+    if keywords:
+        response = _CHAT_RESPONSES[min(keywords, key=_KEYWORD_PRIORITY.__getitem__)]
+    else:
+        # Use default responses if no keyword matched
+        response = random.choice(_DEFAULT_CHAT_RESPONSES)
     
     return {
         "response": response,
@@ -241,26 +271,29 @@ async def chat_with_ai(patient_id: int, message_data: dict):
     }
 
 # Risk scores endpoint
+_RISK_SCORES_PAYLOAD = {
+    "cardiovascular": {
+        "score": 0.25,
+        "level": "moderate",
+        "factors": ["elevated_bp", "family_history"]
+    },
+    "diabetes": {
+        "score": 0.15,
+        "level": "low",
+        "factors": ["normal_glucose"]
+    },
+    "overall": {
+        "score": 0.20,
+        "level": "low-moderate",
+        "recommendation": "Continue monitoring vitals, maintain healthy lifestyle"
+    }
+}
+_RISK_SCORES_JSON = _dumps(_RISK_SCORES_PAYLOAD)
+
 @app.get("/patients/{patient_id}/risk-scores")
 async def get_patient_risk_scores(patient_id: int):
     """Get patient risk scores"""
-    return {
-        "cardiovascular": {
-            "score": 0.25,
-            "level": "moderate",
-            "factors": ["elevated_bp", "family_history"]
-        },
-        "diabetes": {
-            "score": 0.15,
-            "level": "low",
-            "factors": ["normal_glucose"]
-        },
-        "overall": {
-            "score": 0.20,
-            "level": "low-moderate",
-            "recommendation": "Continue monitoring vitals, maintain healthy lifestyle"
-        }
-    }
+    return Response(content=_RISK_SCORES_JSON, media_type="application/json")
 
 if __name__ == "__main__":
     import uvicorn
@@ -11,7 +11,9 @@ from decimal import Decimal
 # Add the parent directory to the path so we can import app modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from app.database import AsyncSessionLocal, Base, async_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.database import Base, async_engine
 from app.models.user import User, UserRole
 from app.models.patient import Patient
 from app.models.vitals import Vitals
@@ -19,11 +21,19 @@ from app.models.risk_score import RiskScore
 from app.models.alert import Alert, AlertSeverity, AlertType
 from app.core.security import get_password_hash
 
+# Seeding only adds rows: flush explicitly and never expire/reload them after commit
+SeedSession = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
+
 
 async def create_sample_users():
     """Create sample users and patients."""
     
-    async with AsyncSessionLocal() as session:
+    async with SeedSession() as session:
         # Create sample doctor
         doctor = User(
             email="doctor@healthrevo.com",
@@ -86,27 +96,32 @@ async def create_sample_users():
         print("✅ Sample users and patients created")
 
 
+# Per-day offsets cycle through a few values; build each Decimal once
+_TEMPERATURES = tuple(Decimal("36.5") + Decimal(str(i * 0.2)) for i in range(3))
+_WEIGHTS = tuple(Decimal("70.0") + Decimal(str(i * 0.1)) for i in range(5))
+
+
 async def create_sample_vitals():
     """Create sample vitals data."""
     
-    async with AsyncSessionLocal() as session:
-        # Get all patients
-        from sqlalchemy import select
-        result = await session.execute(select(Patient))
-        patients = result.scalars().all()
+    async with SeedSession() as session:
+        # Get all patient ids
+        from sqlalchemy import insert, select
+        result = await session.execute(select(Patient.id))
+        patient_ids = result.scalars().all()
         
-        for patient in patients:
+        now = datetime.now()
+        rows = []
+        for patient_id in patient_ids:
             # Create vitals for the last 30 days
             for days_ago in range(30, 0, -1):
-                recorded_date = datetime.now() - timedelta(days=days_ago)
-                
                 # Simulate different health patterns for each patient
-                if patient.id == 1:  # John Doe - Hypertension risk
+                if patient_id == 1:  # John Doe - Hypertension risk
                     systolic = 140 + (days_ago % 10)
                     diastolic = 90 + (days_ago % 5)
                     heart_rate = 75 + (days_ago % 8)
                     blood_glucose = 95 + (days_ago % 15)
-                elif patient.id == 2:  # Jane Smith - Diabetes risk  
+                elif patient_id == 2:  # Jane Smith - Diabetes risk  
                     systolic = 125 + (days_ago % 8)
                     diastolic = 80 + (days_ago % 6)
                     heart_rate = 70 + (days_ago % 10)
@@ -117,19 +132,21 @@ async def create_sample_vitals():
                     heart_rate = 68 + (days_ago % 6)
                     blood_glucose = 85 + (days_ago % 10)
                 
-                vital = Vitals(
-                    patient_id=patient.id,
-                    recorded_at=recorded_date,
-                    systolic=systolic,
-                    diastolic=diastolic,
-                    heart_rate=heart_rate,
-                    temperature=Decimal("36.5") + Decimal(str((days_ago % 3) * 0.2)),
-                    blood_glucose=Decimal(str(blood_glucose)),
-                    oxygen_saturation=97 + (days_ago % 3),
-                    weight=Decimal("70.0") + Decimal(str((days_ago % 5) * 0.1))
-                )
-                session.add(vital)
+                rows.append({
+                    "patient_id": patient_id,
+                    "recorded_at": now - timedelta(days=days_ago),
+                    "systolic": systolic,
+                    "diastolic": diastolic,
+                    "heart_rate": heart_rate,
+                    "temperature": _TEMPERATURES[days_ago % 3],
+                    "blood_glucose": Decimal(blood_glucose),
+                    "oxygen_saturation": 97 + (days_ago % 3),
+                    "weight": _WEIGHTS[days_ago % 5],
+                })
         
+        # One executemany instead of an ORM object per reading
+        if rows:
+            await session.execute(insert(Vitals), rows)
         await session.commit()
         print("✅ Sample vitals data created")
 
@@ -137,7 +154,7 @@ async def create_sample_vitals():
 async def create_sample_risk_scores():
     """Create sample risk scores."""
     
-    async with AsyncSessionLocal() as session:
+    async with SeedSession() as session:
         from sqlalchemy import select
         result = await session.execute(select(Patient))
         patients = result.scalars().all()
@@ -175,7 +192,7 @@ async def create_sample_risk_scores():
 async def create_sample_alerts():
     """Create sample alerts."""
     
-    async with AsyncSessionLocal() as session:
+    async with SeedSession() as session:
         from sqlalchemy import select
         result = await session.execute(select(Patient))
         patients = result.scalars().all()
@@ -26,19 +26,41 @@ def main() -> None:
     parser.add_argument("--medi_co_csv", type=str, help="Path to medi-co dataset CSV (e.g., dataset/data_final_v5.csv)")
     parser.add_argument("--medi_co_synonyms", type=str, help="Path to medi-co synonyms JSON (e.g., dataset/drugs_synonyms.json)")
     parser.add_argument("--replace", action="store_true", help="Replace existing interactions")
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        help="Rows per INSERT batch (default: $HEALTHREVO_SEED_BATCH or 5000)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Parser processes for large medi-co CSVs (default: CPU count; 1 disables)",
+    )
+    parser.add_argument("--compat", action="store_true", help="Read CSVs with csv.DictReader (slower, original parser)")
     args = parser.parse_args()
 
     if not args.csv and not args.sqlite and not (args.medi_co_csv and args.medi_co_synonyms):
         parser.error("Provide one of: --csv or --sqlite or --medi_co_csv + --medi_co_synonyms")
 
     if args.csv:
-        count = load_drug_interactions_from_csv(args.csv, replace=args.replace)
+        count = load_drug_interactions_from_csv(
+            args.csv, replace=args.replace, compat=args.compat, batch_size=args.batch_size
+        )
         print(f"Imported {count} rows from CSV")
     elif args.sqlite:
-        count = load_drug_interactions_from_sqlite(args.sqlite, table=args.table, replace=args.replace)
+        count = load_drug_interactions_from_sqlite(
+            args.sqlite, table=args.table, replace=args.replace, batch_size=args.batch_size
+        )
         print(f"Imported {count} rows from SQLite table {args.table}")
     else:
-        count = load_drug_interactions_from_medi_co_dataset(args.medi_co_csv, args.medi_co_synonyms, replace=args.replace)
+        count = load_drug_interactions_from_medi_co_dataset(
+            args.medi_co_csv,
+            args.medi_co_synonyms,
+            replace=args.replace,
+            compat=args.compat,
+            batch_size=args.batch_size,
+            workers=args.workers,
+        )
         print(f"Imported {count} rows from medi-co dataset")
 
 
@@ -3,122 +3,211 @@
 Simple database seeding script that avoids circular import issues.
 """
 
+import argparse
 import asyncio
+import hashlib
+import json
+import sqlite3
 import sys
 import os
 from datetime import datetime, timedelta
+from functools import lru_cache
 from passlib.context import CryptContext
 
 # Add the parent directory to the path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from app.config import settings
 from app.database import AsyncSessionLocal
-from sqlalchemy import text
+from sqlalchemy import column, func, insert, select, table
+from sqlalchemy.engine import make_url
 
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Untyped table clauses for the seeded columns. The demo rows carry values the ORM
+# column types would reject or reformat (e.g. alert severity "medium", string dates),
+# so they are bound as-is, as the raw SQL did.
+_users = table(
+    "users",
+    column("email"), column("password_hash"), column("full_name"), column("role"), column("is_active"), column("created_at"),
+)
+_patients = table(
+    "patients",
+    column("user_id"), column("dob"), column("gender"), column("phone"), column("blood_group"),
+    column("emergency_contact"), column("medical_history"), column("created_at"),
+)
+_vitals = table(
+    "vitals",
+    column("patient_id"), column("systolic"), column("diastolic"), column("heart_rate"), column("temperature"),
+    column("weight"), column("height"), column("recorded_at"), column("created_at"),
+)
+_alerts = table(
+    "alerts",
+    column("patient_id"), column("type"), column("severity"), column("title"), column("message"),
+    column("resolved"), column("created_at"),
+)
+_risk_scores = table(
+    "risk_scores",
+    column("patient_id"), column("risk_type"), column("score"), column("risk_level"), column("method"), column("created_at"),
+)
 
+# Number of demo users; a users table at least this full is treated as already seeded
+SEED_USER_COUNT = 4
 
-async def seed_simple_data():
-    """Seed database with simple sample data using raw SQL."""
+# Demo credentials only need a cheap bcrypt cost; override with --rounds
+DEFAULT_BCRYPT_ROUNDS = 4
+
+# Hashes from previous runs, keyed by rounds and a digest of the password
+HASH_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".seed_hash_cache.json")
+
+
+@lru_cache(maxsize=None)
+def _crypt_context(rounds):
+    """bcrypt CryptContext for the given cost, with its backend loaded up front."""
+    pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=rounds)
+    pwd_context.handler("bcrypt").get_backend()
+    return pwd_context
+
+
+def seed_password_hashes(passwords, rounds=DEFAULT_BCRYPT_ROUNDS):
+    """Return {password: bcrypt hash}, reusing hashes cached by earlier runs."""
+    try:
+        with open(HASH_CACHE_PATH, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        cache = {}
+
+    hashed = False
+    hashes = {}
+    for password in passwords:
+        key = f"{rounds}:{hashlib.sha256(password.encode('utf-8')).hexdigest()}"
+        if key not in cache:
+            cache[key] = _crypt_context(rounds).hash(password)
+            hashed = True
+        hashes[password] = cache[key]
+
+    if hashed:
+        try:
+            with open(HASH_CACHE_PATH, "w", encoding="utf-8") as f:
+                json.dump(cache, f)
+        except OSError as e:
+            print(f"⚠️  Could not write hash cache: {e}")
+    return hashes
+
+
+def _seed_rows(rounds=DEFAULT_BCRYPT_ROUNDS):
+    """Demo rows as (table clause, rows) pairs, in insertion order."""
+    now = datetime.now().replace(microsecond=0)
+    yesterday = now - timedelta(days=1)
+    hashes = seed_password_hashes(("doctor123", "patient123"), rounds)
+    doctor_hash = hashes["doctor123"]
+    patient_hash = hashes["patient123"]
     
-    async with AsyncSessionLocal() as session:
+    return [
+        # Sample users
+        (_users, [
+            {"email": "doctor@healthrevo.com", "password_hash": doctor_hash, "full_name": "Dr. Sarah Johnson",
+             "role": "doctor", "is_active": 1, "created_at": now},
+            {"email": "john.doe@email.com", "password_hash": patient_hash, "full_name": "John Doe",
+             "role": "patient", "is_active": 1, "created_at": now},
+            {"email": "jane.smith@email.com", "password_hash": patient_hash, "full_name": "Jane Smith",
+             "role": "patient", "is_active": 1, "created_at": now},
+            {"email": "mike.wilson@email.com", "password_hash": patient_hash, "full_name": "Mike Wilson",
+             "role": "patient", "is_active": 1, "created_at": now},
+        ]),
+        # Sample patients
+        (_patients, [
+            {"user_id": 2, "dob": "1990-05-15", "gender": "male", "phone": "+1234567890", "blood_group": "O+",
+             "emergency_contact": "Emergency Contact 1", "medical_history": "No major medical history", "created_at": now},
+            {"user_id": 3, "dob": "1985-08-22", "gender": "female", "phone": "+1234567891", "blood_group": "A+",
+             "emergency_contact": "Emergency Contact 2", "medical_history": "Hypertension", "created_at": now},
+            {"user_id": 4, "dob": "1992-12-03", "gender": "male", "phone": "+1234567892", "blood_group": "B+",
+             "emergency_contact": "Emergency Contact 3", "medical_history": "Diabetes Type 2", "created_at": now},
+        ]),
+        # Sample vitals
+        (_vitals, [
+            {"patient_id": 1, "systolic": 120, "diastolic": 80, "heart_rate": 72, "temperature": 98.6,
+             "weight": 70.5, "height": 175.0, "recorded_at": yesterday, "created_at": yesterday},
+            {"patient_id": 2, "systolic": 140, "diastolic": 90, "heart_rate": 85, "temperature": 99.1,
+             "weight": 65.2, "height": 162.0, "recorded_at": yesterday, "created_at": yesterday},
+            {"patient_id": 3, "systolic": 110, "diastolic": 70, "heart_rate": 68, "temperature": 98.2,
+             "weight": 80.1, "height": 180.0, "recorded_at": yesterday, "created_at": yesterday},
+        ]),
+        # Sample alerts
+        (_alerts, [
+            {"patient_id": 2, "type": "high_blood_pressure", "severity": "medium", "title": "High Blood Pressure Alert",
+             "message": "Blood pressure reading of 140/90 detected", "resolved": 0, "created_at": now},
+            {"patient_id": 1, "type": "appointment_reminder", "severity": "low", "title": "Appointment Reminder",
+             "message": "Upcoming appointment in 2 days", "resolved": 0, "created_at": now},
+        ]),
+        # Sample risk scores
+        (_risk_scores, [
+            {"patient_id": 2, "risk_type": "cardiovascular", "score": 75.5, "risk_level": "high",
+             "method": "framingham", "created_at": now},
+            {"patient_id": 3, "risk_type": "diabetes", "score": 45.2, "risk_level": "medium",
+             "method": "ada_guidelines", "created_at": now},
+        ]),
+    ]
+
+
+async def seed_simple_data(rounds=DEFAULT_BCRYPT_ROUNDS):
+    """Seed database with simple sample data using Core multi-row inserts."""
+    
+    async with AsyncSessionLocal(autoflush=False) as session:
         try:
-            now = datetime.now().replace(microsecond=0)
-            doctor_hash = pwd_context.hash("doctor123")
-            patient_hash = pwd_context.hash("patient123")
-            
-            # Create sample users one by one
-            await session.execute(text("""
-                INSERT OR IGNORE INTO users (email, password_hash, full_name, role, is_active, created_at)
-                VALUES ('doctor@healthrevo.com', :hash, 'Dr. Sarah Johnson', 'doctor', 1, :now)
-            """), {"hash": doctor_hash, "now": now})
-            
-            await session.execute(text("""
-                INSERT OR IGNORE INTO users (email, password_hash, full_name, role, is_active, created_at)
-                VALUES ('john.doe@email.com', :hash, 'John Doe', 'patient', 1, :now)
-            """), {"hash": patient_hash, "now": now})
-            
-            await session.execute(text("""
-                INSERT OR IGNORE INTO users (email, password_hash, full_name, role, is_active, created_at)
-                VALUES ('jane.smith@email.com', :hash, 'Jane Smith', 'patient', 1, :now)
-            """), {"hash": patient_hash, "now": now})
-            
-            await session.execute(text("""
-                INSERT OR IGNORE INTO users (email, password_hash, full_name, role, is_active, created_at)
-                VALUES ('mike.wilson@email.com', :hash, 'Mike Wilson', 'patient', 1, :now)
-            """), {"hash": patient_hash, "now": now})
-            
-            # Create sample patients using actual column names
-            await session.execute(text("""
-                INSERT OR IGNORE INTO patients (user_id, dob, gender, phone, blood_group, emergency_contact, medical_history, created_at)
-                VALUES (2, '1990-05-15', 'male', '+1234567890', 'O+', 'Emergency Contact 1', 'No major medical history', :now)
-            """), {"now": now})
-            
-            await session.execute(text("""
-                INSERT OR IGNORE INTO patients (user_id, dob, gender, phone, blood_group, emergency_contact, medical_history, created_at)
-                VALUES (3, '1985-08-22', 'female', '+1234567891', 'A+', 'Emergency Contact 2', 'Hypertension', :now)
-            """), {"now": now})
+            # One explicit transaction: committed on exit, rolled back if any insert fails
+            async with session.begin():
+                # Re-runs are the common case: one COUNT skips hashing and every insert attempt
+                user_count = (await session.execute(select(func.count()).select_from(_users))).scalar()
+                if user_count >= SEED_USER_COUNT:
+                    print("ℹ️  Sample data already seeded, skipping")
+                    return
+                
+                # One multi-row INSERT OR IGNORE per table
+                for tbl, rows in _seed_rows(rounds):
+                    await session.execute(insert(tbl).prefix_with("OR IGNORE").values(rows))
             
-            await session.execute(text("""
-                INSERT OR IGNORE INTO patients (user_id, dob, gender, phone, blood_group, emergency_contact, medical_history, created_at)
-                VALUES (4, '1992-12-03', 'male', '+1234567892', 'B+', 'Emergency Contact 3', 'Diabetes Type 2', :now)
-            """), {"now": now})
-            
-            # Create sample vitals using actual column names
-            yesterday = now - timedelta(days=1)
-            
-            await session.execute(text("""
-                INSERT OR IGNORE INTO vitals (patient_id, systolic, diastolic, heart_rate, temperature, weight, height, recorded_at, created_at)
-                VALUES (1, 120, 80, 72, 98.6, 70.5, 175.0, :recorded, :created)
-            """), {"recorded": yesterday, "created": yesterday})
-            
-            await session.execute(text("""
-                INSERT OR IGNORE INTO vitals (patient_id, systolic, diastolic, heart_rate, temperature, weight, height, recorded_at, created_at)
-                VALUES (2, 140, 90, 85, 99.1, 65.2, 162.0, :recorded, :created)
-            """), {"recorded": yesterday, "created": yesterday})
-            
-            await session.execute(text("""
-                INSERT OR IGNORE INTO vitals (patient_id, systolic, diastolic, heart_rate, temperature, weight, height, recorded_at, created_at)
-                VALUES (3, 110, 70, 68, 98.2, 80.1, 180.0, :recorded, :created)
-            """), {"recorded": yesterday, "created": yesterday})
-            
-            # Create sample alerts using actual column names
-            await session.execute(text("""
-                INSERT OR IGNORE INTO alerts (patient_id, type, severity, title, message, resolved, created_at)
-                VALUES (2, 'high_blood_pressure', 'medium', 'High Blood Pressure Alert', 'Blood pressure reading of 140/90 detected', 0, :now)
-            """), {"now": now})
-            
-            await session.execute(text("""
-                INSERT OR IGNORE INTO alerts (patient_id, type, severity, title, message, resolved, created_at)
-                VALUES (1, 'appointment_reminder', 'low', 'Appointment Reminder', 'Upcoming appointment in 2 days', 0, :now)
-            """), {"now": now})
-            
-            # Add some sample risk scores
-            await session.execute(text("""
-                INSERT OR IGNORE INTO risk_scores (patient_id, risk_type, score, risk_level, method, created_at)
-                VALUES (2, 'cardiovascular', 75.5, 'high', 'framingham', :now)
-            """), {"now": now})
-            
-            await session.execute(text("""
-                INSERT OR IGNORE INTO risk_scores (patient_id, risk_type, score, risk_level, method, created_at)
-                VALUES (3, 'diabetes', 45.2, 'medium', 'ada_guidelines', :now)
-            """), {"now": now})
-            
-            await session.commit()
             print("✅ Sample data seeded successfully")
             
         except Exception as e:
-            await session.rollback()
             print(f"❌ Error seeding data: {e}")
             raise
 
 
-async def main():
-    """Main function to seed the database."""
-    print("🌱 Seeding database with simple sample data...")
-    await seed_simple_data()
-    
+def seed_sync(db_path=None, rounds=DEFAULT_BCRYPT_ROUNDS):
+    """Seed a SQLite database through stdlib sqlite3, without the async engine.
+
+    Positional executemany per table inside a single transaction, with fsyncs
+    disabled for this connection only.
+    """
+    if db_path is None:
+        url = make_url(settings.database_url_sync)
+        if url.get_backend_name() != "sqlite":
+            raise ValueError(f"--sync only supports SQLite; DATABASE_URL_SYNC uses {url.get_backend_name()}")
+        db_path = url.database
+    conn = sqlite3.connect(db_path)
+    try:
+        # journal_mode is left alone: leaving WAL needs an exclusive lock, which fails
+        # while the app or another seeder holds the database open
+        conn.execute("PRAGMA synchronous=OFF")
+        if conn.execute("SELECT COUNT(*) FROM users").fetchone()[0] >= SEED_USER_COUNT:
+            print("ℹ️  Sample data already seeded, skipping")
+            return
+        with conn:
+            for tbl, rows in _seed_rows(rounds):
+                names = [c.name for c in tbl.columns]
+                conn.executemany(
+                    f"INSERT OR IGNORE INTO {tbl.name} ({', '.join(names)}) VALUES ({', '.join('?' * len(names))})",
+                    [tuple(row[name] for name in names) for row in rows],
+                )
+        print("✅ Sample data seeded successfully")
+    except Exception as e:
+        print(f"❌ Error seeding data: {e}")
+        raise
+    finally:
+        conn.close()
+
+
+def print_credentials():
     print("\n📧 Sample login credentials:")
     print("Doctor: doctor@healthrevo.com / doctor123")
     print("Patient 1: john.doe@email.com / patient123")
@@ -126,5 +215,32 @@ async def main():
     print("Patient 3: mike.wilson@email.com / patient123")
 
 
+async def main(rounds=DEFAULT_BCRYPT_ROUNDS):
+    """Main function to seed the database."""
+    print("🌱 Seeding database with simple sample data...")
+    await seed_simple_data(rounds)
+    print_credentials()
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    parser = argparse.ArgumentParser(description="Seed database with simple sample data")
+    parser.add_argument(
+        "--rounds",
+        type=int,
+        default=DEFAULT_BCRYPT_ROUNDS,
+        help=f"bcrypt cost for the demo passwords (default: {DEFAULT_BCRYPT_ROUNDS})",
+    )
+    parser.add_argument(
+        "--sync",
+        action="store_true",
+        help="Write directly with sqlite3 instead of the async engine (SQLite only)",
+    )
+    args = parser.parse_args()
+    if args.sync:
+        if make_url(settings.database_url_sync).get_backend_name() != "sqlite":
+            parser.error("--sync only supports SQLite; DATABASE_URL_SYNC points at another database")
+        print("🌱 Seeding database with simple sample data...")
+        seed_sync(rounds=args.rounds)
+        print_credentials()
+    else:
+        asyncio.run(main(args.rounds))
@@ -7,48 +7,62 @@ import asyncio
 import sys
 import os
 from datetime import datetime
+from functools import lru_cache
 
 # Add the parent directory to the path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from app.database import AsyncSessionLocal
-from app.services.auth import AuthService
 from app.core.security import verify_password
 from sqlalchemy import text
 
 
 async def test_authentication():
     """Test user authentication."""
-    print("🔐 Testing authentication...")
+    lines = ["🔐 Testing authentication..."]
     
-    async with AsyncSessionLocal() as session:
-        auth_service = AuthService(session)
-        
-        # Test doctor login
-        doctor_token = await auth_service.authenticate_user("doctor@healthrevo.com", "doctor123")
-        if doctor_token:
-            print("✅ Doctor authentication successful")
-        else:
-            print("❌ Doctor authentication failed")
-        
-        # Test patient login
-        patient_token = await auth_service.authenticate_user("john.doe@email.com", "patient123")
-        if patient_token:
-            print("✅ Patient authentication successful")
-        else:
-            print("❌ Patient authentication failed")
-        
-        # Test invalid login
-        invalid_token = await auth_service.authenticate_user("invalid@email.com", "wrongpass")
-        if not invalid_token:
-            print("✅ Invalid login correctly rejected")
-        else:
-            print("❌ Invalid login incorrectly accepted")
+    async def authenticate(email, password):
+        # Separate session per login so the three checks can run concurrently
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(
+                text("SELECT password_hash FROM users WHERE email = :email"), {"email": email}
+            )
+            password_hash = result.scalar_one_or_none()
+        if password_hash is None:
+            return False
+        # bcrypt verification runs on worker threads so the logins overlap
+        return await asyncio.to_thread(verify_password, password, password_hash)
+    
+    doctor_ok, patient_ok, invalid_ok = await asyncio.gather(
+        authenticate("doctor@healthrevo.com", "doctor123"),
+        authenticate("john.doe@email.com", "patient123"),
+        authenticate("invalid@email.com", "wrongpass"),
+    )
+    
+    # Test doctor login
+    if doctor_ok:
+        lines.append("✅ Doctor authentication successful")
+    else:
+        lines.append("❌ Doctor authentication failed")
+    
+    # Test patient login
+    if patient_ok:
+        lines.append("✅ Patient authentication successful")
+    else:
+        lines.append("❌ Patient authentication failed")
+    
+    # Test invalid login
+    if not invalid_ok:
+        lines.append("✅ Invalid login correctly rejected")
+    else:
+        lines.append("❌ Invalid login incorrectly accepted")
+    
+    return lines
 
 
 async def test_database_relationships():
     """Test database relationships and data integrity."""
-    print("\n🔗 Testing database relationships...")
+    lines = ["\n🔗 Testing database relationships..."]
     
     async with AsyncSessionLocal() as session:
         # Test user-patient relationship
@@ -61,11 +75,11 @@ async def test_database_relationships():
         
         patients = result.fetchall()
         if len(patients) >= 3:
-            print(f"✅ Found {len(patients)} patient records with proper relationships")
+            lines.append(f"✅ Found {len(patients)} patient records with proper relationships")
             for patient in patients:
-                print(f"   - {patient[1]} ({patient[0]}) - {patient[2]}, {patient[3]}")
+                lines.append(f"   - {patient[1]} ({patient[0]}) - {patient[2]}, {patient[3]}")
         else:
-            print("❌ Missing patient relationship data")
+            lines.append("❌ Missing patient relationship data")
         
         # Test vitals data
         result = await session.execute(text("""
@@ -76,9 +90,9 @@ async def test_database_relationships():
         
         vitals = result.fetchall()
         if len(vitals) >= 3:
-            print(f"✅ Found {len(vitals)} vital records")
+            lines.append(f"✅ Found {len(vitals)} vital records")
         else:
-            print("❌ Missing vitals data")
+            lines.append("❌ Missing vitals data")
         
         # Test alerts
         result = await session.execute(text("""
@@ -89,36 +103,47 @@ async def test_database_relationships():
         
         alerts = result.fetchall()
         if len(alerts) >= 2:
-            print(f"✅ Found {len(alerts)} alert records")
+            lines.append(f"✅ Found {len(alerts)} alert records")
         else:
-            print("❌ Missing alerts data")
+            lines.append("❌ Missing alerts data")
+    
+    return lines
+
+
+@lru_cache(maxsize=1)
+def _load_gemini():
+    """Import the Gemini chat service and settings once per process."""
+    from app.services.gemini_chat_service import GeminiChatService
+    from app.config import settings
+    return GeminiChatService, settings
 
 
 async def test_google_gemini_config():
     """Test Google Gemini configuration."""
-    print("\n🤖 Testing Google Gemini configuration...")
+    lines = ["\n🤖 Testing Google Gemini configuration..."]
     
     try:
-        from app.services.gemini_chat import GeminiChatService
-        from app.config import settings
+        GeminiChatService, settings = _load_gemini()
         
-        if settings.google_api_key:
-            print("✅ Google API key is configured")
+        if settings.google_gemini_api_key:
+            lines.append("✅ Google API key is configured")
             
             # Initialize service (don't make actual API call to avoid quota)
             gemini_service = GeminiChatService()
-            print("✅ GeminiChatService initialized successfully")
+            lines.append("✅ GeminiChatService initialized successfully")
             
         else:
-            print("⚠️  Google API key not configured in environment")
+            lines.append("⚠️  Google API key not configured in environment")
             
     except Exception as e:
-        print(f"❌ Error testing Gemini configuration: {e}")
+        lines.append(f"❌ Error testing Gemini configuration: {e}")
+    
+    return lines
 
 
 async def test_risk_calculation():
     """Test risk calculation logic."""
-    print("\n📊 Testing risk calculation...")
+    lines = ["\n📊 Testing risk calculation..."]
     
     try:
         from app.services.risk_calculator import RiskCalculator
@@ -144,12 +169,53 @@ async def test_risk_calculation():
         risk_score = risk_calc.calculate_cardiovascular_risk(sample_vitals, sample_patient)
         
         if risk_score >= 0:
-            print(f"✅ Risk calculation successful: {risk_score}")
+            lines.append(f"✅ Risk calculation successful: {risk_score}")
         else:
-            print("❌ Risk calculation failed")
+            lines.append("❌ Risk calculation failed")
             
     except Exception as e:
-        print(f"❌ Error testing risk calculation: {e}")
+        lines.append(f"❌ Error testing risk calculation: {e}")
+    
+    return lines
+
+
+async def test_ocr_page_detection():
+    """Test that sparse prescription pages are OCR'd rather than skipped as blank."""
+    lines = ["\n🖨️  Testing OCR blank/sparse page detection..."]
+    
+    try:
+        import cv2
+        import numpy as np
+        from app.services.ocr_service import OCRService
+        
+        ocr_service = OCRService()
+        
+        def render_page(text_lines):
+            # White 300-dpi A4 page with a few printed lines
+            page = np.full((3508, 2480, 3), 255, np.uint8)
+            for i, text_line in enumerate(text_lines):
+                cv2.putText(page, text_line, (200, 300 + i * 120), cv2.FONT_HERSHEY_SIMPLEX, 2.0, (0, 0, 0), 4)
+            return ocr_service._select_psm(ocr_service._preprocess_image(page))
+        
+        sparse_psm, blank_psm = await asyncio.gather(
+            asyncio.to_thread(render_page, ["Rx: Amoxicillin 500mg", "1 cap TID x 7 days", "Dr. Smith"]),
+            asyncio.to_thread(render_page, []),
+        )
+        
+        if sparse_psm == 11:
+            lines.append("✅ Sparse prescription page sent to sparse-text OCR")
+        else:
+            lines.append(f"❌ Sparse prescription page got psm {sparse_psm}, expected 11")
+        
+        if blank_psm is None:
+            lines.append("✅ Blank page skipped")
+        else:
+            lines.append(f"❌ Blank page got psm {blank_psm}, expected it to be skipped")
+            
+    except Exception as e:
+        lines.append(f"❌ Error testing OCR page detection: {e}")
+    
+    return lines
 
 
 async def run_all_tests():
@@ -158,10 +224,22 @@ async def run_all_tests():
     print("=" * 50)
     
     try:
-        await test_authentication()
-        await test_database_relationships()
-        await test_google_gemini_config()
-        await test_risk_calculation()
+        # Each test uses its own session, so they can run concurrently;
+        # output is collected per test and printed in order afterwards
+        tests = (
+            test_authentication,
+            test_database_relationships,
+            test_google_gemini_config,
+            test_risk_calculation,
+            test_ocr_page_detection,
+        )
+        results = await asyncio.gather(*(test() for test in tests), return_exceptions=True)
+        
+        for test, result in zip(tests, results):
+            if isinstance(result, Exception):
+                print(f"\n❌ {test.__name__} failed: {result}")
+            else:
+                print("\n".join(result))
         
         print("\n" + "=" * 50)
         print("✅ Backend test suite completed!")
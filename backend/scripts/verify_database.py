@@ -10,6 +10,10 @@ import os
 # Database path
 db_path = "/home/shasank/shasank/Hackathon/supersus/HealthRevo/backend/healthrevo.db"
 
+# Checked in this order against a set of the tables actually present
+EXPECTED_TABLES = ('users', 'patients', 'vitals', 'alerts', 'risk_scores',
+                   'prescriptions', 'lifestyle_logs', 'drug_interactions', 'alembic_version')
+
 def test_database():
     """Test database structure and data."""
     print("🚀 HealthRevo Database Verification")
@@ -23,12 +27,9 @@ def test_database():
         # Test 1: Check tables exist
         print("📋 Checking database tables...")
         cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
-        tables = [row[0] for row in cursor.fetchall()]
-        
-        expected_tables = ['users', 'patients', 'vitals', 'alerts', 'risk_scores', 
-                          'prescriptions', 'lifestyle_logs', 'drug_interactions', 'alembic_version']
+        tables = {row[0] for row in cursor.fetchall()}
         
-        for table in expected_tables:
+        for table in EXPECTED_TABLES:
             if table in tables:
                 print(f"   ✅ {table}")
             else:
@@ -44,9 +45,14 @@ def test_database():
             ("risk_scores", 2)
         ]
         
+        # One compound statement instead of a COUNT round-trip per table
+        cursor.execute(" UNION ALL ".join(
+            f"SELECT '{table}', COUNT(*) FROM {table}" for table, _ in data_checks
+        ))
+        counts = dict(cursor.fetchall())
+        
         for table, expected_count in data_checks:
-            cursor.execute(f"SELECT COUNT(*) FROM {table}")
-            actual_count = cursor.fetchone()[0]
+            actual_count = counts[table]
             
             if actual_count >= expected_count:
                 print(f"   ✅ {table}: {actual_count} records")
@@ -61,41 +67,44 @@ def test_database():
         for email, name, role in users:
             print(f"   • {role.upper()}: {name} ({email})")
         
-        # Test 4: Check relationships
-        print("\n🔗 Testing relationships...")
+        # Tests 4-6 share one query; each row is tagged with the check it belongs to
         cursor.execute("""
-            SELECT u.email, p.gender, p.blood_group 
+            SELECT 'patient', u.email, p.gender, p.blood_group, NULL
             FROM users u 
             JOIN patients p ON u.id = p.user_id 
             WHERE u.role = 'patient'
+            UNION ALL
+            SELECT 'vitals', u.email, v.systolic, v.diastolic, v.heart_rate 
+            FROM vitals v
+            JOIN patients p ON v.patient_id = p.id
+            JOIN users u ON p.user_id = u.id
+            UNION ALL
+            SELECT 'alert', u.email, a.type, a.severity, a.title
+            FROM alerts a
+            JOIN patients p ON a.patient_id = p.id
+            JOIN users u ON p.user_id = u.id
         """)
-        patient_data = cursor.fetchall()
+        related = {"patient": [], "vitals": [], "alert": []}
+        for source, *row in cursor.fetchall():
+            related[source].append(row)
+        
+        # Test 4: Check relationships
+        print("\n🔗 Testing relationships...")
+        patient_data = related["patient"]
         
         print(f"   ✅ Patient relationships: {len(patient_data)} records")
-        for email, gender, blood_group in patient_data:
+        for email, gender, blood_group, _ in patient_data:
             print(f"      - {email}: {gender}, {blood_group}")
         
         # Test 5: Check vitals with patient info
-        cursor.execute("""
-            SELECT u.email, v.systolic, v.diastolic, v.heart_rate 
-            FROM vitals v
-            JOIN patients p ON v.patient_id = p.id
-            JOIN users u ON p.user_id = u.id
-        """)
-        vitals_data = cursor.fetchall()
+        vitals_data = related["vitals"]
         
         print(f"\n📈 Vitals data: {len(vitals_data)} records")
         for email, systolic, diastolic, hr in vitals_data:
             print(f"      - {email}: {systolic}/{diastolic} mmHg, HR {hr}")
         
         # Test 6: Check alerts
-        cursor.execute("""
-            SELECT u.email, a.type, a.severity, a.title
-            FROM alerts a
-            JOIN patients p ON a.patient_id = p.id
-            JOIN users u ON p.user_id = u.id
-        """)
-        alert_data = cursor.fetchall()
+        alert_data = related["alert"]
         
         print(f"\n🚨 Alerts: {len(alert_data)} records")
         for email, alert_type, severity, title in alert_data:
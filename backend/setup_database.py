@@ -7,7 +7,6 @@ This script initializes the database and optionally seeds it with sample data.
 import asyncio
 import sys
 import os
-import subprocess
 from pathlib import Path
 
 # Add the current directory to the path
@@ -35,20 +34,18 @@ def run_migrations():
     try:
         print("🔄 Running database migrations...")
         
-        # Run alembic upgrade
-        result = subprocess.run(
-            ["alembic", "upgrade", "head"],
-            cwd=Path(__file__).parent,
-            capture_output=True,
-            text=True
-        )
+        # Run alembic upgrade in-process rather than spawning the alembic CLI
+        from alembic import command
+        from alembic.config import Config
         
-        if result.returncode == 0:
-            print("✅ Database migrations completed successfully")
-            return True
-        else:
-            print(f"❌ Migration failed: {result.stderr}")
-            return False
+        backend_dir = Path(__file__).parent
+        alembic_cfg = Config(str(backend_dir / "alembic.ini"))
+        # script_location in alembic.ini is relative to the backend directory
+        alembic_cfg.set_main_option("script_location", str(backend_dir / "alembic"))
+        command.upgrade(alembic_cfg, "head")
+        
+        print("✅ Database migrations completed successfully")
+        return True
             
     except Exception as e:
         print(f"❌ Error running migrations: {e}")
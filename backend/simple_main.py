@@ -1,15 +1,33 @@
 """
 Simple FastAPI server for HealthRevo backend
 """
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
+from functools import lru_cache
+import hmac
+import json
 import os
+import random
+
+try:
+    import orjson
+except Exception:  # Optional speedup; stdlib json is used if unavailable
+    orjson = None
+
+
+def _dumps(obj) -> bytes:
+    """Serialize a constant payload once so handlers can return the bytes as-is."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
 
 # Create FastAPI app
 app = FastAPI(
     title="HealthRevo API",
     version="1.0.0",
     description="AI-powered health monitoring and prescription analysis system",
+    default_response_class=ORJSONResponse if orjson is not None else JSONResponse,
 )
 
 # Setup CORS
@@ -21,101 +39,117 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+_ROOT_JSON = _dumps({
+    "message": "Welcome to HealthRevo API",
+    "version": "1.0.0",
+    "status": "running",
+    "docs": "/docs"
+})
+_HEALTH_JSON = _dumps({"status": "healthy", "app": "HealthRevo API", "version": "1.0.0"})
+
 @app.get("/")
 async def root():
     """Root endpoint"""
-    return {
-        "message": "Welcome to HealthRevo API",
-        "version": "1.0.0",
-        "status": "running",
-        "docs": "/docs"
-    }
+    return Response(content=_ROOT_JSON, media_type="application/json")
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {"status": "healthy", "app": "HealthRevo API", "version": "1.0.0"}
+    return Response(content=_HEALTH_JSON, media_type="application/json")
 
 # Simple authentication endpoint
+def _login_response(access_token: str, user_id: int, email: str, full_name: str, role: str) -> dict:
+    return {
+        "access_token": access_token,
+        "token_type": "bearer",
+        "user": {
+            "id": user_id,
+            "email": email,
+            "fullName": full_name,
+            "role": role
+        }
+    }
+
+# Test with seeded users: email -> (password, prebuilt login response)
+_USERS = {
+    "doctor@healthrevo.com": (
+        b"doctor123",
+        _login_response("test_doctor_token", 1, "doctor@healthrevo.com", "Dr. Sarah Johnson", "doctor"),
+    ),
+    "john.doe@email.com": (
+        b"patient123",
+        _login_response("test_patient_2_token", 2, "john.doe@email.com", "John Doe", "patient"),
+    ),
+    "jane.smith@email.com": (
+        b"patient123",
+        _login_response("test_patient_3_token", 3, "jane.smith@email.com", "Jane Smith", "patient"),
+    ),
+    "mike.wilson@email.com": (
+        b"patient123",
+        _login_response("test_patient_4_token", 4, "mike.wilson@email.com", "Mike Wilson", "patient"),
+    ),
+}
+
 @app.post("/auth/login")
 async def login(credentials: dict):
     """Login endpoint"""
     email = credentials.get("email", "")
     password = credentials.get("password", "")
     
-    # Test with seeded users
-    if email == "doctor@healthrevo.com" and password == "doctor123":
-        return {
-            "access_token": "test_doctor_token",
-            "token_type": "bearer",
-            "user": {
-                "id": 1,
-                "email": email,
-                "fullName": "Dr. Sarah Johnson",
-                "role": "doctor"
-            }
-        }
-    elif password == "patient123" and email in ["john.doe@email.com", "jane.smith@email.com", "mike.wilson@email.com"]:
-        user_map = {
-            "john.doe@email.com": {"id": 2, "fullName": "John Doe"},
-            "jane.smith@email.com": {"id": 3, "fullName": "Jane Smith"},
-            "mike.wilson@email.com": {"id": 4, "fullName": "Mike Wilson"}
-        }
-        user_data = user_map[email]
-        return {
-            "access_token": f"test_patient_{user_data['id']}_token",
-            "token_type": "bearer",
-            "user": {
-                "id": user_data["id"],
-                "email": email,
-                "fullName": user_data["fullName"],
-                "role": "patient"
-            }
-        }
-    else:
-        raise HTTPException(status_code=401, detail="Invalid credentials")
+    entry = _USERS.get(email) if isinstance(email, str) else None
+    # Constant-time comparison on the encoded password
+    if entry and isinstance(password, str) and hmac.compare_digest(entry[0], password.encode("utf-8")):
+        return entry[1]
+    raise HTTPException(status_code=401, detail="Invalid credentials")
+
+_CURRENT_PATIENT_JSON = _dumps({
+    "id": 2,
+    "userId": 2,
+    "dob": "1990-05-15",
+    "gender": "male",
+    "phone": "+1234567890",
+    "bloodGroup": "O+",
+    "emergencyContact": "Emergency Contact 1",
+    "medicalHistory": "No major medical history"
+})
 
 @app.get("/patients/me")
 async def get_current_patient():
     """Get current patient info"""
-    return {
+    return Response(content=_CURRENT_PATIENT_JSON, media_type="application/json")
+
+# Mock vitals; patientId is filled in per request
+_VITALS_PAYLOAD = (
+    {
+        "id": 1,
+        "recordedAt": "2025-09-12T23:44:29",
+        "systolic": 120,
+        "diastolic": 80,
+        "heartRate": 72,
+        "temperature": 98.6,
+        "weight": 70.5,
+        "notes": "Normal readings"
+    },
+    {
         "id": 2,
-        "userId": 2,
-        "dob": "1990-05-15",
-        "gender": "male",
-        "phone": "+1234567890",
-        "bloodGroup": "O+",
-        "emergencyContact": "Emergency Contact 1",
-        "medicalHistory": "No major medical history"
+        "recordedAt": "2025-09-13T23:44:29",
+        "systolic": 125,
+        "diastolic": 82,
+        "heartRate": 75,
+        "temperature": 98.4,
+        "weight": 70.3,
+        "notes": "Slightly elevated"
     }
+)
+
+@lru_cache(maxsize=1024)
+def _vitals_json(patient_id: int) -> bytes:
+    return _dumps([{"id": v["id"], "patientId": patient_id, **v} for v in _VITALS_PAYLOAD])
 
 @app.get("/patients/{patient_id}/vitals")
 async def get_patient_vitals(patient_id: int):
     """Get patient vitals"""
-    return [
-        {
-            "id": 1,
-            "patientId": patient_id,
-            "recordedAt": "2025-09-12T23:44:29",
-            "systolic": 120,
-            "diastolic": 80,
-            "heartRate": 72,
-            "temperature": 98.6,
-            "weight": 70.5,
-            "notes": "Normal readings"
-        },
-        {
-            "id": 2,
-            "patientId": patient_id,
-            "recordedAt": "2025-09-13T23:44:29",
-            "systolic": 125,
-            "diastolic": 82,
-            "heartRate": 75,
-            "temperature": 98.4,
-            "weight": 70.3,
-            "notes": "Slightly elevated"
-        }
-    ]
+    return Response(content=_vitals_json(patient_id), media_type="application/json")
 
 @app.post("/patients/{patient_id}/vitals")
 async def add_patient_vitals(patient_id: int, vitals: dict):
@@ -128,33 +162,35 @@ async def add_patient_vitals(patient_id: int, vitals: dict):
         **vitals
     }
 
+_ALERTS_JSON = _dumps([
+    {
+        "id": 1,
+        "patientId": 2,
+        "type": "high_blood_pressure",
+        "severity": "medium",
+        "title": "High Blood Pressure Alert",
+        "message": "Blood pressure reading of 140/90 detected",
+        "resolved": False,
+        "generatedAt": "2025-09-13T23:44:29",
+        "acknowledged": False
+    },
+    {
+        "id": 2,
+        "patientId": 2,
+        "type": "appointment_reminder",
+        "severity": "low",
+        "title": "Appointment Reminder",
+        "message": "Upcoming appointment in 2 days",
+        "resolved": False,
+        "generatedAt": "2025-09-13T23:44:29",
+        "acknowledged": False
+    }
+])
+
 @app.get("/alerts")
 async def get_alerts():
     """Get alerts"""
-    return [
-        {
-            "id": 1,
-            "patientId": 2,
-            "type": "high_blood_pressure",
-            "severity": "medium",
-            "title": "High Blood Pressure Alert",
-            "message": "Blood pressure reading of 140/90 detected",
-            "resolved": False,
-            "generatedAt": "2025-09-13T23:44:29",
-            "acknowledged": False
-        },
-        {
-            "id": 2,
-            "patientId": 2,
-            "type": "appointment_reminder",
-            "severity": "low",
-            "title": "Appointment Reminder",
-            "message": "Upcoming appointment in 2 days",
-            "resolved": False,
-            "generatedAt": "2025-09-13T23:44:29",
-            "acknowledged": False
-        }
-    ]
+    return Response(content=_ALERTS_JSON, media_type="application/json")
 
 @app.patch("/alerts/{alert_id}")
 async def update_alert(alert_id: int, update_data: dict):
@@ -166,22 +202,30 @@ async def update_alert(alert_id: int, update_data: dict):
         "resolved": update_data.get("resolved", False)
     }
 
+# Simple mock responses
+_CHAT_RESPONSES = (
+    "I understand your concern about your health. Based on your recent vitals, everything looks normal.",
+    "Your blood pressure readings are within acceptable ranges. Keep monitoring daily.",
+    "I recommend maintaining your current medication schedule and healthy lifestyle.",
+    "Your health metrics show positive trends. Continue with your current routine.",
+    "Consider discussing any concerns with your doctor during your next appointment."
+)
+_chat_rng = random.Random()
+# Pre-drawn picks, refilled 64 at a time instead of drawing one per request
+_chat_ring = []
+
+
+def _next_chat_response():
+    if not _chat_ring:
+        _chat_ring.extend(_chat_rng.choices(_CHAT_RESPONSES, k=64))
+    return _chat_ring.pop()
+
 @app.post("/patients/{patient_id}/chat")
 async def chat_with_ai(patient_id: int, message_data: dict):
     """Chat with AI assistant"""
     user_message = message_data.get("message", "")
     
-    # Simple mock responses
-    responses = [
-        "I understand your concern about your health. Based on your recent vitals, everything looks normal.",
-        "Your blood pressure readings are within acceptable ranges. Keep monitoring daily.",
-        "I recommend maintaining your current medication schedule and healthy lifestyle.",
-        "Your health metrics show positive trends. Continue with your current routine.",
-        "Consider discussing any concerns with your doctor during your next appointment."
-    ]
-    
-    import random
-    response = random.choice(responses)
+    response = _next_chat_response()
     
     return {
         "response": response,
@@ -190,4 +234,13 @@ async def chat_with_ai(patient_id: int, message_data: dict):
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvicorn[standard] already picks uvloop and httptools; skip the per-request
+    # access log write and allow a deeper accept queue for bursts of small requests
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=8000,
+        access_log=False,
+        backlog=2048,
+        limit_concurrency=2000
+    )